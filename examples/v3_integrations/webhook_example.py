@@ -241,7 +241,8 @@ def health_check():
 
 def generate_test_signature(payload: dict, secret: str) -> str:
     """Generate HMAC signature for testing."""
-    payload_bytes = json.dumps(payload, sort_keys=True).encode()
+    # Same canonical form the receiver re-serializes parsed payloads to
+    payload_bytes = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
     return hmac.new(secret.encode(), payload_bytes, hashlib.sha256).hexdigest()
 
 
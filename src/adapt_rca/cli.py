@@ -1,6 +1,8 @@
-import argparse
 import json
+import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional
 
 from .config import RCAConfig
 from .ingestion.file_loader import load_jsonl
@@ -10,12 +12,49 @@ from .reasoning.agent import analyze_incident
 from .reporting.formatter import format_human_readable
 from .version import __version__
 
-def main() -> None:
+# Flags that take a value; everything else goes through argparse.
+_VALUE_FLAGS = ("--input", "--output")
+
+
+def _build_parser():
+    # argparse is only imported when actually needed (--help, --version, errors)
+    import argparse
+
     parser = argparse.ArgumentParser(description="ADAPT-RCA CLI")
     parser.add_argument("--version", action="version", version=f"ADAPT-RCA {__version__}")
     parser.add_argument("--input", required=True, help="Path to JSONL log file")
     parser.add_argument("--output", help="Path to write JSON result")
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_args(argv: List[str]) -> SimpleNamespace:
+    """
+    Parse command line arguments.
+
+    The common invocation (``--input X [--output Y]``) is handled by a small
+    hand-rolled parser so argparse is never imported. Anything else (help,
+    version, unknown or abbreviated flags, missing values) is delegated to
+    argparse, which keeps usage and error output unchanged.
+    """
+    args = SimpleNamespace(input=None, output=None)
+    it = iter(argv)
+    for arg in it:
+        name, sep, value = arg.partition("=")
+        if name not in _VALUE_FLAGS:
+            return _build_parser().parse_args(argv)
+        if not sep:
+            value = next(it, None)
+            if value is None or value.startswith("-"):
+                return _build_parser().parse_args(argv)
+        setattr(args, name[2:], value)
+
+    if args.input is None:
+        return _build_parser().parse_args(argv)
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
 
     config = RCAConfig()  # future use
 
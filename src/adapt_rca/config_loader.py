@@ -5,32 +5,150 @@ Supports loading configuration from YAML and TOML files with environment variabl
 overrides and a standard search path.
 """
 
+import copy
+import functools
+import json
 import os
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Tuple
+
+from .exceptions import InvalidConfigError
+
+try:
+    import yaml
+    # Prefer the libyaml C loader; fall back to the pure-Python one
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None
+
+try:
+    # Python 3.11+ has tomllib built-in
+    import tomllib
+except ImportError:  # pragma: no cover - depends on Python version
+    try:
+        # Fallback to tomli for older Python versions
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    # orjson is noticeably faster for reading the JSON cache sidecars
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Parsed config files keyed by absolute path: (st_mtime_ns, st_size, config).
+# Entries are only reused while the file's mtime and size are unchanged.
+_FILE_CACHE: "OrderedDict[str, Tuple[int, int, dict]]" = OrderedDict()
+_CACHE_MAX = 64
 
-def load_yaml_file(path: Path) -> dict:
+
+def _sidecar_path(path: Path) -> Path:
+    """Return the path of the JSON cache sidecar for a config file."""
+    return path.with_name(path.name + ".cache.json")
+
+
+def _sidecar_header(st: os.stat_result) -> str:
+    return f"# src-mtime:{st.st_mtime_ns} size:{st.st_size}\n"
+
+
+def _read_sidecar(path: Path, st: os.stat_result) -> Optional[dict]:
     """
-    Load configuration from a YAML file.
+    Read the JSON cache sidecar for ``path`` if it matches the source file.
+
+    Returns:
+        The cached configuration, or None if the sidecar is missing, stale
+        or unreadable
+    """
+    try:
+        with open(_sidecar_path(path), 'rb') as f:
+            if f.readline() != _sidecar_header(st).encode():
+                return None
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_sidecar(path: Path, st: os.stat_result, config: dict) -> None:
+    """
+    Write a JSON cache sidecar next to ``path``.
+
+    This is best-effort: configs that don't round-trip through JSON (e.g.
+    TOML datetimes) are skipped, as are read-only directories.
+    """
+    try:
+        payload = json.dumps(config)
+    except (TypeError, ValueError):
+        return
+    if json.loads(payload) != config:
+        return
+
+    sidecar = _sidecar_path(path)
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(_sidecar_header(st))
+            f.write(payload)
+        os.replace(tmp, sidecar)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {sidecar}: {e}")
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _load_cached(path: Path, parse: Callable[[Path], dict]) -> dict:
+    """
+    Return the parsed contents of ``path``, reusing a cached parse if valid.
+
+    The cache is an LRU keyed by absolute path and validated against the
+    file's modification time and size. On a miss, a JSON sidecar written by
+    a previous process is tried before parsing the file itself.
+
+    The returned dict is the cached object itself; callers that hand it out
+    or mutate it must copy it first.
 
     Args:
-        path: Path to the YAML file
+        path: Path to the configuration file
+        parse: Function that reads and parses the file
 
     Returns:
         Dictionary containing configuration data
-
-    Raises:
-        ImportError: If PyYAML is not installed
-        FileNotFoundError: If file doesn't exist
-        Exception: If YAML parsing fails
     """
-    try:
-        import yaml
-    except ImportError:
+    st = path.stat()
+    key = str(path.resolve())
+
+    entry = _FILE_CACHE.get(key)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        _FILE_CACHE.move_to_end(key)
+        return entry[2]
+
+    config = _read_sidecar(path, st)
+    if config is None:
+        config = parse(path)
+        _write_sidecar(path, st, config)
+
+    _FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+    _FILE_CACHE.move_to_end(key)
+    if len(_FILE_CACHE) > _CACHE_MAX:
+        _FILE_CACHE.popitem(last=False)
+
+    return config
+
+
+def clear_config_cache() -> None:
+    """Drop all cached config file parses and merged configurations."""
+    _FILE_CACHE.clear()
+    _load_merged_config.cache_clear()
+
+
+def _read_yaml_file(path: Path) -> dict:
+    if yaml is None:
         raise ImportError(
             "PyYAML is required for YAML config files. "
             "Install with: pip install pyyaml"
@@ -39,12 +157,77 @@ def load_yaml_file(path: Path) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    try:
-        with open(path, 'r') as f:
-            config = yaml.safe_load(f)
-            return config if config is not None else {}
-    except Exception as e:
-        raise Exception(f"Failed to parse YAML config file {path}: {e}")
+    def parse(p: Path) -> dict:
+        # Binary mode lets the loader detect and decode the encoding itself
+        with open(p, 'rb') as f:
+            try:
+                config = yaml.load(f, Loader=_YamlLoader)
+            except yaml.YAMLError as e:
+                raise InvalidConfigError(f"Failed to parse YAML config file {p}: {e}") from e
+        return config if config is not None else {}
+
+    return _load_cached(path, parse)
+
+
+def _read_toml_file(path: Path) -> dict:
+    if tomllib is None:
+        raise ImportError(
+            "tomli is required for TOML config files on Python < 3.11. "
+            "Install with: pip install tomli"
+        )
+
+    if not path.exists():
+        raise FileNotFoundError(f"Config file not found: {path}")
+
+    def parse(p: Path) -> dict:
+        with open(p, 'rb') as f:
+            try:
+                return tomllib.load(f)
+            except (tomllib.TOMLDecodeError, UnicodeDecodeError) as e:
+                raise InvalidConfigError(f"Failed to parse TOML config file {p}: {e}") from e
+
+    return _load_cached(path, parse)
+
+
+# Config file readers by (lowercased) file extension. Readers return the
+# shared cached dict; the public load_* functions return copies.
+_LOADERS: Dict[str, Callable[[Path], dict]] = {
+    ".yaml": _read_yaml_file,
+    ".yml": _read_yaml_file,
+    ".toml": _read_toml_file,
+}
+
+
+def _read_config_file(path: str) -> dict:
+    """Like load_config_file(), but returns the shared cached dict uncopied."""
+    file_path = Path(path)
+    suffix = file_path.suffix.lower()
+
+    loader = _LOADERS.get(suffix)
+    if loader is None:
+        raise ValueError(
+            f"Unsupported config file format: {suffix}. "
+            "Supported formats: .yaml, .yml, .toml"
+        )
+    return loader(file_path)
+
+
+def load_yaml_file(path: Path) -> dict:
+    """
+    Load configuration from a YAML file.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Dictionary containing configuration data
+
+    Raises:
+        ImportError: If PyYAML is not installed
+        FileNotFoundError: If file doesn't exist
+        InvalidConfigError: If YAML parsing fails
+    """
+    return copy.deepcopy(_read_yaml_file(path))
 
 
 def load_toml_file(path: Path) -> dict:
@@ -60,31 +243,9 @@ def load_toml_file(path: Path) -> dict:
     Raises:
         ImportError: If tomli/tomllib is not installed
         FileNotFoundError: If file doesn't exist
-        Exception: If TOML parsing fails
+        InvalidConfigError: If TOML parsing fails
     """
-    try:
-        # Python 3.11+ has tomllib built-in
-        import tomllib
-        open_mode = 'rb'
-    except ImportError:
-        try:
-            # Fallback to tomli for older Python versions
-            import tomli as tomllib
-            open_mode = 'rb'
-        except ImportError:
-            raise ImportError(
-                "tomli is required for TOML config files on Python < 3.11. "
-                "Install with: pip install tomli"
-            )
-
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-
-    try:
-        with open(path, open_mode) as f:
-            return tomllib.load(f)
-    except Exception as e:
-        raise Exception(f"Failed to parse TOML config file {path}: {e}")
+    return copy.deepcopy(_read_toml_file(path))
 
 
 def load_config_file(path: str) -> dict:
@@ -92,6 +253,7 @@ def load_config_file(path: str) -> dict:
     Load configuration from a YAML or TOML file.
 
     The file format is determined by the file extension (.yaml, .yml, or .toml).
+    Parsed files are cached; a copy is returned so callers may mutate it.
 
     Args:
         path: Path to the configuration file
@@ -102,20 +264,25 @@ def load_config_file(path: str) -> dict:
     Raises:
         ValueError: If file extension is not supported
         FileNotFoundError: If file doesn't exist
-        Exception: If parsing fails
+        InvalidConfigError: If parsing fails
     """
-    file_path = Path(path)
-    suffix = file_path.suffix.lower()
+    return copy.deepcopy(_read_config_file(path))
 
-    if suffix in ['.yaml', '.yml']:
-        return load_yaml_file(file_path)
-    elif suffix == '.toml':
-        return load_toml_file(file_path)
-    else:
-        raise ValueError(
-            f"Unsupported config file format: {suffix}. "
-            "Supported formats: .yaml, .yml, .toml"
-        )
+
+def _search_dirs() -> Tuple[Tuple[Path, Tuple[str, ...]], ...]:
+    """
+    Return the config search directories and the file names to look for.
+
+    Resolved on every call, so os.chdir() and $HOME changes take effect.
+    """
+    return (
+        # Current directory
+        (Path.cwd(), ("adapt-rca.yaml", "adapt-rca.toml")),
+        # User home directory
+        (Path.home(), (".adapt-rca.yaml", ".adapt-rca.toml")),
+        # System-wide configuration
+        (Path("/etc"), ("adapt-rca.yaml", "adapt-rca.toml")),
+    )
 
 
 def find_config_file() -> Optional[Path]:
@@ -133,97 +300,65 @@ def find_config_file() -> Optional[Path]:
     Returns:
         Path to the first configuration file found, or None if no file is found
     """
-    search_paths = [
-        # Current directory
-        Path.cwd() / "adapt-rca.yaml",
-        Path.cwd() / "adapt-rca.toml",
-        # User home directory
-        Path.home() / ".adapt-rca.yaml",
-        Path.home() / ".adapt-rca.toml",
-        # System-wide configuration
-        Path("/etc/adapt-rca.yaml"),
-        Path("/etc/adapt-rca.toml"),
-    ]
-
-    for path in search_paths:
-        if path.exists() and path.is_file():
-            logger.info(f"Found configuration file: {path}")
-            return path
+    for parent, names in _search_dirs():
+        for name in names:
+            path = parent / name
+            # is_file() is False for missing paths, so one stat per candidate
+            if path.is_file():
+                logger.info(f"Found configuration file: {path}")
+                return path
 
     logger.debug("No configuration file found in standard locations")
     return None
 
 
+def _to_bool(value: str) -> bool:
+    return value.lower() in ("true", "1", "yes")
+
+
+# (environment variable, config section, field, cast)
+_ENV_SPEC: Tuple[Tuple[str, str, str, Callable[[str], Any]], ...] = (
+    # LLM configuration
+    ("ADAPT_RCA_LLM_PROVIDER", "llm", "provider", str),
+    ("ADAPT_RCA_LLM_MODEL", "llm", "model", str),
+    ("ADAPT_RCA_LLM_TIMEOUT", "llm", "timeout", int),
+    # Processing configuration
+    ("ADAPT_RCA_MAX_EVENTS", "processing", "max_events", int),
+    ("ADAPT_RCA_TIME_WINDOW", "processing", "time_window_minutes", int),
+    ("ADAPT_RCA_MAX_FILE_SIZE_MB", "processing", "max_file_size_mb", int),
+    # Analysis configuration
+    ("ADAPT_RCA_USE_CAUSAL_GRAPH", "analysis", "use_causal_graph", _to_bool),
+    ("ADAPT_RCA_CONFIDENCE_THRESHOLD", "analysis", "confidence_threshold", float),
+    # Logging configuration
+    ("ADAPT_RCA_LOG_LEVEL", "logging", "level", str),
+    ("ADAPT_RCA_LOG_FILE", "logging", "file", str),
+)
+
+
 def get_env_config() -> dict:
     """
     Extract configuration from environment variables.
 
-    Environment variables override file-based configuration.
+    Environment variables override file-based configuration. The supported
+    variables are listed in ``_ENV_SPEC``; unset or empty variables are
+    skipped and values that fail to parse are logged and ignored.
 
     Returns:
         Dictionary containing configuration from environment variables
     """
-    config = {}
-
-    # LLM configuration
-    llm_config = {}
-    if os.getenv("ADAPT_RCA_LLM_PROVIDER"):
-        llm_config["provider"] = os.getenv("ADAPT_RCA_LLM_PROVIDER")
-    if os.getenv("ADAPT_RCA_LLM_MODEL"):
-        llm_config["model"] = os.getenv("ADAPT_RCA_LLM_MODEL")
-    if os.getenv("ADAPT_RCA_LLM_TIMEOUT"):
-        try:
-            llm_config["timeout"] = int(os.getenv("ADAPT_RCA_LLM_TIMEOUT"))
-        except ValueError:
-            logger.warning("Invalid ADAPT_RCA_LLM_TIMEOUT, ignoring")
-
-    if llm_config:
-        config["llm"] = llm_config
-
-    # Processing configuration
-    processing_config = {}
-    if os.getenv("ADAPT_RCA_MAX_EVENTS"):
-        try:
-            processing_config["max_events"] = int(os.getenv("ADAPT_RCA_MAX_EVENTS"))
-        except ValueError:
-            logger.warning("Invalid ADAPT_RCA_MAX_EVENTS, ignoring")
-    if os.getenv("ADAPT_RCA_TIME_WINDOW"):
-        try:
-            processing_config["time_window_minutes"] = int(os.getenv("ADAPT_RCA_TIME_WINDOW"))
-        except ValueError:
-            logger.warning("Invalid ADAPT_RCA_TIME_WINDOW, ignoring")
-    if os.getenv("ADAPT_RCA_MAX_FILE_SIZE_MB"):
-        try:
-            processing_config["max_file_size_mb"] = int(os.getenv("ADAPT_RCA_MAX_FILE_SIZE_MB"))
-        except ValueError:
-            logger.warning("Invalid ADAPT_RCA_MAX_FILE_SIZE_MB, ignoring")
-
-    if processing_config:
-        config["processing"] = processing_config
+    config: Dict[str, Dict[str, Any]] = {}
+    env = os.environ
 
-    # Analysis configuration
-    analysis_config = {}
-    if os.getenv("ADAPT_RCA_USE_CAUSAL_GRAPH"):
-        value = os.getenv("ADAPT_RCA_USE_CAUSAL_GRAPH").lower()
-        analysis_config["use_causal_graph"] = value in ("true", "1", "yes")
-    if os.getenv("ADAPT_RCA_CONFIDENCE_THRESHOLD"):
+    for name, section, field, cast in _ENV_SPEC:
+        raw = env.get(name)
+        if not raw:
+            continue
         try:
-            analysis_config["confidence_threshold"] = float(os.getenv("ADAPT_RCA_CONFIDENCE_THRESHOLD"))
+            value = cast(raw)
         except ValueError:
-            logger.warning("Invalid ADAPT_RCA_CONFIDENCE_THRESHOLD, ignoring")
-
-    if analysis_config:
-        config["analysis"] = analysis_config
-
-    # Logging configuration
-    logging_config = {}
-    if os.getenv("ADAPT_RCA_LOG_LEVEL"):
-        logging_config["level"] = os.getenv("ADAPT_RCA_LOG_LEVEL")
-    if os.getenv("ADAPT_RCA_LOG_FILE"):
-        logging_config["file"] = os.getenv("ADAPT_RCA_LOG_FILE")
-
-    if logging_config:
-        config["logging"] = logging_config
+            logger.warning(f"Invalid {name}, ignoring")
+            continue
+        config.setdefault(section, {})[field] = value
 
     return config
 
@@ -232,6 +367,10 @@ def deep_merge(base: dict, override: dict) -> dict:
     """
     Deep merge two dictionaries, with override values taking precedence.
 
+    If either dictionary is empty the other one is returned as-is rather
+    than copied, so callers must not mutate the result if they still need
+    the inputs unchanged.
+
     Args:
         base: Base dictionary
         override: Override dictionary (values take precedence)
@@ -239,17 +378,61 @@ def deep_merge(base: dict, override: dict) -> dict:
     Returns:
         Merged dictionary
     """
-    result = base.copy()
-
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    if not override:
+        return base
+    if not base:
+        return override
+
+    result = dict(base)
+
+    # Walk nested dicts with an explicit stack; only dicts present on both
+    # sides are copied, everything else is assigned directly.
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = dict(current)
+                dst[key] = merged
+                stack.append((merged, value))
+            else:
+                dst[key] = value
 
     return result
 
 
+_MISSING = object()
+
+# Nested config section -> ((field, RCAConfig field), ...), built once at import
+_FLATTEN_TABLE: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...] = (
+    ("llm", (
+        ("provider", "llm_provider"),
+        ("model", "llm_model"),
+        ("timeout", "llm_timeout"),
+    )),
+    ("processing", (
+        ("max_events", "max_events"),
+        ("time_window_minutes", "time_window_minutes"),
+        ("max_file_size_mb", "max_file_size_mb"),
+    )),
+    ("analysis", (
+        ("use_causal_graph", "use_causal_graph"),
+        ("confidence_threshold", "confidence_threshold"),
+    )),
+    ("logging", (
+        ("level", "log_level"),
+        ("file", "log_file"),
+    )),
+)
+
+
+def _section(config: dict, name: str) -> dict:
+    """Return ``config[name]`` if it is a dict, otherwise an empty dict."""
+    section = config.get(name)
+    return section if isinstance(section, dict) else {}
+
+
 def flatten_config(config: dict) -> dict:
     """
     Flatten nested configuration dictionary to match RCAConfig fields.
@@ -264,42 +447,13 @@ def flatten_config(config: dict) -> dict:
         Flattened configuration dictionary
     """
     flat = {}
-
-    # LLM settings
-    if "llm" in config:
-        llm = config["llm"]
-        if "provider" in llm:
-            flat["llm_provider"] = llm["provider"]
-        if "model" in llm:
-            flat["llm_model"] = llm["model"]
-        if "timeout" in llm:
-            flat["llm_timeout"] = llm["timeout"]
-
-    # Processing settings
-    if "processing" in config:
-        proc = config["processing"]
-        if "max_events" in proc:
-            flat["max_events"] = proc["max_events"]
-        if "time_window_minutes" in proc:
-            flat["time_window_minutes"] = proc["time_window_minutes"]
-        if "max_file_size_mb" in proc:
-            flat["max_file_size_mb"] = proc["max_file_size_mb"]
-
-    # Analysis settings (for future use)
-    if "analysis" in config:
-        analysis = config["analysis"]
-        if "use_causal_graph" in analysis:
-            flat["use_causal_graph"] = analysis["use_causal_graph"]
-        if "confidence_threshold" in analysis:
-            flat["confidence_threshold"] = analysis["confidence_threshold"]
-
-    # Logging settings (for future use)
-    if "logging" in config:
-        log = config["logging"]
-        if "level" in log:
-            flat["log_level"] = log["level"]
-        if "file" in log:
-            flat["log_file"] = log["file"]
+    for section_name, fields in _FLATTEN_TABLE:
+        section = _section(config, section_name)
+        if not section:
+            continue
+        for field, flat_key in fields:
+            if field in section:
+                flat[flat_key] = section[field]
 
     return flat
 
@@ -317,17 +471,73 @@ def merge_config(file_config: dict, env_config: dict) -> dict:
     Returns:
         Merged configuration dictionary (flattened)
     """
-    # Deep merge the nested configs (env takes precedence)
-    merged = deep_merge(file_config, env_config)
+    # Read each known field straight from both sources (env first) instead of
+    # building an intermediate deep-merged dict and flattening it afterwards
+    flat = {}
+    for section_name, fields in _FLATTEN_TABLE:
+        env_section = _section(env_config, section_name)
+        file_section = _section(file_config, section_name)
+        if not env_section and not file_section:
+            continue
+        for field, flat_key in fields:
+            value = env_section.get(field, _MISSING)
+            if value is _MISSING:
+                value = file_section.get(field, _MISSING)
+            if value is not _MISSING:
+                flat[flat_key] = value
+
+    return flat
+
+
+def _env_fingerprint() -> Tuple[Optional[str], ...]:
+    """Return the current values of all supported ADAPT_RCA_* variables."""
+    env = os.environ
+    return tuple(env.get(spec[0]) for spec in _ENV_SPEC)
 
-    # Flatten to match RCAConfig structure
-    return flatten_config(merged)
+
+def _file_fingerprint(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for ``path``, or None if it can't be stat'ed."""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_merged_config(
+    path: Optional[str],
+    file_fingerprint: Optional[Tuple[int, int]],
+    env_fingerprint: Tuple[Optional[str], ...],
+) -> dict:
+    # The fingerprints are only part of the cache key: a changed file or
+    # environment yields a new key and therefore a fresh load.
+    # merge_config only reads from file_config, so the cached parse can be
+    # used directly without copying it
+    file_config = {}
+    if path:
+        file_config = _read_config_file(path)
+        logger.info(f"Loaded configuration from: {path}")
+
+    # Get environment overrides
+    env_config = get_env_config()
+    if env_config:
+        logger.info("Applying environment variable overrides")
+
+    # Merge and return
+    return merge_config(file_config, env_config)
 
 
 def load_config_with_overrides(config_path: Optional[str] = None) -> dict:
     """
     Load configuration from file with environment variable overrides.
 
+    Results are memoized on the config file path, its mtime and size, and
+    the values of the ADAPT_RCA_* environment variables, so repeated calls
+    in a long-running process only redo the work when one of those changes.
+
     Args:
         config_path: Optional explicit path to config file.
                     If None, searches standard locations.
@@ -337,26 +547,15 @@ def load_config_with_overrides(config_path: Optional[str] = None) -> dict:
 
     Raises:
         FileNotFoundError: If explicit config_path is provided but doesn't exist
-        Exception: If config parsing fails
+        InvalidConfigError: If config parsing fails
     """
-    file_config = {}
-
-    # Load from file
     if config_path:
         # Explicit path provided
-        file_config = load_config_file(config_path)
-        logger.info(f"Loaded configuration from: {config_path}")
+        path: Optional[str] = config_path
     else:
         # Search for config file
         found_path = find_config_file()
-        if found_path:
-            file_config = load_config_file(str(found_path))
-            logger.info(f"Loaded configuration from: {found_path}")
-
-    # Get environment overrides
-    env_config = get_env_config()
-    if env_config:
-        logger.info("Applying environment variable overrides")
+        path = str(found_path) if found_path else None
 
-    # Merge and return
-    return merge_config(file_config, env_config)
+    merged = _load_merged_config(path, _file_fingerprint(path), _env_fingerprint())
+    return copy.deepcopy(merged)
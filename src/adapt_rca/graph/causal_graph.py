@@ -14,9 +14,9 @@ class CausalGraph:
     """
 
     def __init__(self):
-        self.nodes = []
-        self.edges = []
-        self._node_ids = set()
+        self.nodes: Dict[str, Dict] = {}
+        # Adjacency map: from_node -> to_node -> evidence
+        self._adj: Dict[str, Dict[str, List[str]]] = {}
 
     def add_node(self, node_id: str, metadata: Dict = None):
         """
@@ -32,15 +32,17 @@ class CausalGraph:
         if not node_id or not isinstance(node_id, str):
             raise GraphBuildError("Node ID must be a non-empty string")
         
-        if node_id in self._node_ids:
+        if node_id in self.nodes:
             raise GraphBuildError(f"Node '{node_id}' already exists")
         
-        self.nodes.append({"id": node_id, "metadata": metadata or {}})
-        self._node_ids.add(node_id)
+        self.nodes[node_id] = {"id": node_id, "metadata": metadata or {}}
 
     def add_edge(self, from_node: str, to_node: str, evidence: List[str] = None):
         """
         Add a directed edge with optional evidence.
+
+        Adding an edge that already exists between the same two nodes is a
+        no-op.
         
         Args:
             from_node: Source node ID
@@ -51,20 +53,61 @@ class CausalGraph:
             NodeNotFoundError: If either node doesn't exist
             GraphBuildError: If edge is invalid
         """
-        if from_node not in self._node_ids:
+        if from_node not in self.nodes:
             raise NodeNotFoundError(f"Source node '{from_node}' not found")
         
-        if to_node not in self._node_ids:
+        if to_node not in self.nodes:
             raise NodeNotFoundError(f"Target node '{to_node}' not found")
         
         if from_node == to_node:
             raise GraphBuildError("Self-loops are not allowed")
-        
-        self.edges.append({
-            "from": from_node,
-            "to": to_node,
-            "evidence": evidence or []
-        })
+
+        targets = self._adj.setdefault(from_node, {})
+        if to_node not in targets:
+            targets[to_node] = evidence or []
+
+    def has_edge(self, from_node: str, to_node: str) -> bool:
+        """
+        Check whether a directed edge exists.
+
+        Args:
+            from_node: Source node ID
+            to_node: Target node ID
+
+        Returns:
+            True if the edge from_node -> to_node exists
+        """
+        return to_node in self._adj.get(from_node, {})
+
+    def neighbors(self, node_id: str) -> List[str]:
+        """
+        Get the targets of a node's outgoing edges.
+
+        Args:
+            node_id: Node identifier
+
+        Returns:
+            List of target node IDs, in the order the edges were added
+        """
+        return list(self._adj.get(node_id, {}))
+
+    def edge_count(self) -> int:
+        """
+        Get the number of edges in the graph.
+
+        Returns:
+            Edge count
+        """
+        return sum(len(targets) for targets in self._adj.values())
+
+    @property
+    def edges(self) -> List[Dict]:
+        """Edges as a list of ``{"from", "to", "evidence"}`` dictionaries."""
+        return [
+            {"from": from_node, "to": to_node, "evidence": evidence}
+            for from_node, targets in self._adj.items()
+            for to_node, evidence in targets.items()
+        ]
 
     def get_node(self, node_id: str) -> Optional[Dict]:
         """
@@ -79,11 +122,10 @@ class CausalGraph:
         Raises:
             NodeNotFoundError: If node doesn't exist
         """
-        for node in self.nodes:
-            if node["id"] == node_id:
-                return node
-        
-        raise NodeNotFoundError(f"Node '{node_id}' not found")
+        node = self.nodes.get(node_id)
+        if node is None:
+            raise NodeNotFoundError(f"Node '{node_id}' not found")
+        return node
 
     def to_dict(self) -> Dict:
         """
@@ -94,7 +136,7 @@ class CausalGraph:
         """
         try:
             return {
-                "nodes": self.nodes,
+                "nodes": list(self.nodes.values()),
                 "edges": self.edges
             }
         except (AttributeError, KeyError) as e:
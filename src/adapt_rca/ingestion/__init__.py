@@ -2,6 +2,6 @@
 Ingestion layer for ADAPT-RCA.
 """
 
-__all__ = ['load_jsonl']
+__all__ = ['load_jsonl', 'load_jsonl_batches', 'load_jsonl_columns']
 
-from .file_loader import load_jsonl
+from .file_loader import load_jsonl, load_jsonl_batches, load_jsonl_columns
@@ -4,6 +4,7 @@ CSV log file loader.
 import csv
 import logging
 from pathlib import Path
+from sys import intern
 from typing import Iterable, Dict, Any, List, Optional
 
 from ..utils import validate_file_size, get_file_size, format_bytes, PathValidationError
@@ -11,6 +12,9 @@ from ..constants import MAX_FILE_SIZE_BYTES
 
 logger = logging.getLogger(__name__)
 
+# Low-cardinality event fields whose values are interned to share storage
+_INTERNED_FIELDS = frozenset({"level", "service"})
+
 
 def load_csv(
     path: str | Path,
@@ -64,29 +68,44 @@ def load_csv(
 
     try:
         with path.open(encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f, delimiter=delimiter) if has_header else csv.reader(f, delimiter=delimiter)
+            reader = csv.reader(f, delimiter=delimiter)
+
+            if has_header:
+                header = next(reader, None) or []
+                # Resolve mapped columns to row indices once (the last column
+                # wins if a name repeats, as with csv.DictReader)
+                positions = {name: i for i, name in enumerate(header)}
+                columns = [
+                    (positions[csv_field], event_field, event_field in _INTERNED_FIELDS)
+                    for csv_field, event_field in field_mapping.items()
+                    if csv_field in positions
+                ]
 
             for row in reader:
-                row_number += 1
-
                 if has_header:
+                    if not row:  # Blank lines are not rows
+                        continue
+                    row_number += 1
+
                     # Map CSV fields to event fields
                     event = {}
-                    for csv_field, event_field in field_mapping.items():
-                        if csv_field in row and row[csv_field]:
-                            event[event_field] = row[csv_field]
+                    width = len(row)
+                    for i, event_field, shared in columns:
+                        if i < width and row[i]:
+                            event[event_field] = intern(row[i]) if shared else row[i]
 
                     if event:  # Only yield if we got some data
                         valid_rows += 1
                         yield event
                 else:
+                    row_number += 1
                     # Without header, assume standard order: timestamp, service, level, message
                     if len(row) >= 4:
                         valid_rows += 1
                         yield {
                             "timestamp": row[0],
-                            "service": row[1],
-                            "level": row[2],
+                            "service": intern(row[1]),
+                            "level": intern(row[2]),
                             "message": row[3]
                         }
 
@@ -1,12 +1,100 @@
 from pathlib import Path
-from typing import Iterable, Dict
-import json
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Sequence
 import logging
+import mmap
+import os
+from sys import intern
+
+try:
+    # orjson parses bytes directly and is several times faster per line
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _json_loads
 
 from ..exceptions import FileLoadError, InvalidFormatError
 
 logger = logging.getLogger(__name__)
 
+# Bytes read per chunk when splitting JSONL files into lines
+_CHUNK_SIZE = 1024 * 1024
+# Files at least this large are memory-mapped instead of read in chunks
+_MMAP_THRESHOLD = _CHUNK_SIZE
+# Low-cardinality fields whose string values are interned, so every event
+# with the same level/service shares one string object
+_INTERNED_FIELDS = ("level", "service")
+
+
+def _iter_lines(f: BinaryIO, chunk_size: int = _CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Split a binary file into lines, reading it in large chunks.
+
+    Newlines are located with ``bytes.find`` rather than the file object's
+    line iterator, so the scan runs in C over whole chunks.
+
+    Args:
+        f: File opened in binary mode
+        chunk_size: Number of bytes to read at a time
+
+    Yields:
+        Lines without their trailing newline
+    """
+    # Pieces of a line that spans chunk boundaries; joined once the line
+    # ends so a very long line costs O(length) rather than O(length^2).
+    pending: List[bytes] = []
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        nl = chunk.find(b'\n')
+        if nl < 0:
+            pending.append(chunk)
+            continue
+        if pending:
+            pending.append(chunk[:nl])
+            yield b''.join(pending)
+            pending.clear()
+        else:
+            yield chunk[:nl]
+        pos = nl + 1
+        while True:
+            nl = chunk.find(b'\n', pos)
+            if nl < 0:
+                break
+            yield chunk[pos:nl]
+            pos = nl + 1
+        if pos < len(chunk):
+            pending.append(chunk[pos:])
+    if pending:
+        yield b''.join(pending)
+
+
+def _iter_mmap_lines(f: BinaryIO) -> Iterator[bytes]:
+    """
+    Split a binary file into lines by memory-mapping it.
+
+    The whole file is scanned for newlines in place, with pages loaded by
+    the kernel on demand, so no read buffers are allocated.
+
+    Args:
+        f: Non-empty file opened in binary mode
+
+    Yields:
+        Lines without their trailing newline
+    """
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        find = mm.find
+        pos = 0
+        while True:
+            nl = find(b'\n', pos)
+            if nl < 0:
+                break
+            yield mm[pos:nl]
+            pos = nl + 1
+        if pos < len(mm):
+            yield mm[pos:]
+
 
 def load_jsonl(path: str | Path) -> Iterable[Dict]:
     """
@@ -31,21 +119,120 @@ def load_jsonl(path: str | Path) -> Iterable[Dict]:
         raise FileLoadError(f"Not a file: {path}")
     
     try:
-        with path.open() as f:
+        # Lines are parsed as raw bytes; the JSON parser handles the UTF-8
+        # decoding and surrounding whitespace itself.
+        with path.open('rb') as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                lines = _iter_mmap_lines(f)
+            else:
+                lines = _iter_lines(f)
             line_number = 0
-            for line in f:
+            skipped_lines = 0
+            sample_errors: List[str] = []
+            for line in lines:
                 line_number += 1
-                line = line.strip()
-                if not line:
+                if not line or line.isspace():
                     continue
                 try:
-                    yield json.loads(line)
-                except json.JSONDecodeError as e:
-                    logger.warning(
-                        f"Skipping invalid JSON at line {line_number}: {e}"
-                    )
+                    obj = _json_loads(line)
+                except ValueError as e:
+                    _check_encoding(line)
+                    # Reported once after the loop rather than per line
+                    skipped_lines += 1
+                    if len(sample_errors) < 5:
+                        sample_errors.append(f"line {line_number}: {e}")
                     continue
+                if type(obj) is dict:
+                    for key in _INTERNED_FIELDS:
+                        value = obj.get(key)
+                        if type(value) is str:
+                            obj[key] = intern(value)
+                yield obj
+
+            if skipped_lines:
+                logger.warning(
+                    f"Skipped {skipped_lines} invalid JSON lines in {path}; "
+                    f"first {len(sample_errors)}: {'; '.join(sample_errors)}"
+                )
     except OSError as e:
         raise FileLoadError(f"Failed to read file {path}: {e}") from e
+
+
+def _check_encoding(line: bytes) -> None:
+    """Raise InvalidFormatError if a line that failed to parse isn't UTF-8."""
+    try:
+        line.decode('utf-8')
     except UnicodeDecodeError as e:
         raise InvalidFormatError(f"Invalid file encoding: {e}") from e
+
+
+def load_jsonl_batches(path: str | Path, batch_size: int = 8192) -> Iterable[List[Dict]]:
+    """
+    Load a JSONL file in lists of parsed objects.
+
+    Consumers that process events in bulk can work a batch at a time
+    instead of one object per iteration.
+
+    Args:
+        path: Path to JSONL file
+        batch_size: Maximum number of objects per batch
+
+    Yields:
+        Lists of parsed JSON objects; only the last may be shorter than
+        batch_size
+
+    Raises:
+        ValueError: If batch_size is not positive
+        FileLoadError: If file cannot be opened
+        InvalidFormatError: If file format is invalid
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    batch = []
+    for obj in load_jsonl(path):
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def load_jsonl_columns(
+    path: str | Path,
+    fields: Sequence[str] = ("timestamp", "service", "level", "message")
+) -> Dict[str, List[Any]]:
+    """
+    Load selected fields of a JSONL file as parallel column lists.
+
+    Each object contributes one entry to every column (None where the field
+    is missing), so index i across the columns describes the i-th object.
+    Lines that are not JSON objects are skipped.
+
+    Args:
+        path: Path to JSONL file
+        fields: Field names to extract
+
+    Returns:
+        Mapping of field name to list of values
+
+    Raises:
+        FileLoadError: If file cannot be opened
+        InvalidFormatError: If file format is invalid
+
+    Example:
+        >>> cols = load_jsonl_columns("events.jsonl")
+        >>> cols["level"].count("ERROR")
+    """
+    columns: Dict[str, List[Any]] = {field: [] for field in fields}
+    appenders = [(field, columns[field].append) for field in columns]
+
+    for obj in load_jsonl(path):
+        if not isinstance(obj, dict):
+            continue
+        get = obj.get
+        for field, append in appenders:
+            append(get(field))
+
+    return columns
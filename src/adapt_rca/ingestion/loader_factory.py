@@ -14,15 +14,25 @@ Example:
     >>> events = list(loader.load('events.jsonl'))
 """
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, Dict, Any, Optional, Callable
+from typing import Iterable, Dict, Any, List, Optional, Callable, Sequence, Tuple
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
 
 class FileLoader(ABC):
-    """Abstract base class for file loaders."""
+    """
+    Abstract base class for file loaders.
+
+    Subclasses list the file extensions they handle in the
+    ``SUPPORTED_EXTENSIONS`` class attribute (or override the
+    ``supported_extensions`` property).
+    """
+
+    SUPPORTED_EXTENSIONS: Tuple[str, ...] = ()
 
     @abstractmethod
     def load(
@@ -43,40 +53,77 @@ class FileLoader(ABC):
         pass
 
     @property
-    @abstractmethod
-    def supported_extensions(self) -> list[str]:
-        """Return list of supported file extensions."""
-        pass
+    def supported_extensions(self) -> Sequence[str]:
+        """Return the supported file extensions."""
+        return self.SUPPORTED_EXTENSIONS
+
+    def load_batches(
+        self,
+        path: str | Path,
+        batch_size: int = 8192,
+        **kwargs
+    ) -> Iterable[List[Dict[str, Any]]]:
+        """
+        Load events from file in lists of up to batch_size events.
+
+        Args:
+            path: Path to file
+            batch_size: Maximum number of events per batch
+            **kwargs: Additional loader-specific parameters, passed to load()
+
+        Yields:
+            Lists of event dictionaries
+
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        batch = []
+        for event in self.load(path, **kwargs):
+            batch.append(event)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
 
 class JSONLLoader(FileLoader):
     """Loader for JSONL (JSON Lines) files."""
 
+    SUPPORTED_EXTENSIONS = ('.jsonl', '.json')
+
     def load(
         self,
         path: str | Path,
         max_file_size: Optional[int] = None,
-        strict: bool = False,
         **kwargs
     ) -> Iterable[Dict[str, Any]]:
         """Load events from JSONL file."""
         from .file_loader import load_jsonl
         from ..constants import MAX_FILE_SIZE_BYTES
+        from ..utils import validate_file_size, PathValidationError
 
-        return load_jsonl(
-            path,
-            max_file_size=max_file_size or MAX_FILE_SIZE_BYTES,
-            strict=strict
-        )
+        try:
+            validate_file_size(
+                Path(path),
+                max_size_bytes=max_file_size or MAX_FILE_SIZE_BYTES,
+                raise_on_error=True
+            )
+        except PathValidationError as e:
+            raise ValueError(str(e)) from e
+
+        return load_jsonl(path)
 
-    @property
-    def supported_extensions(self) -> list[str]:
-        return ['.jsonl', '.json']
 
 
 class CSVLoader(FileLoader):
     """Loader for CSV files."""
 
+    SUPPORTED_EXTENSIONS = ('.csv',)
+
     def load(
         self,
         path: str | Path,
@@ -92,14 +139,13 @@ class CSVLoader(FileLoader):
             max_file_size=max_file_size or MAX_FILE_SIZE_BYTES
         )
 
-    @property
-    def supported_extensions(self) -> list[str]:
-        return ['.csv']
 
 
 class TextLoader(FileLoader):
     """Loader for text/syslog files."""
 
+    SUPPORTED_EXTENSIONS = ('.log', '.txt', '.syslog')
+
     def load(
         self,
         path: str | Path,
@@ -119,9 +165,36 @@ class TextLoader(FileLoader):
             custom_pattern=custom_pattern
         )
 
-    @property
-    def supported_extensions(self) -> list[str]:
-        return ['.log', '.txt', '.syslog']
+
+
+def _prefetch(paths: List[Path]) -> None:
+    """
+    Ask the kernel to start reading files into the page cache.
+
+    Readahead for every file is issued up front so that disk reads for later
+    files overlap with parsing of earlier ones. This is a no-op on platforms
+    without posix_fadvise.
+    """
+    advise = getattr(os, "posix_fadvise", None)
+    if advise is None:
+        return
+
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue  # The loader reports the error when it gets there
+        try:
+            advise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _load_file(path: Path, kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Load a whole file in a worker process (generators can't be pickled)."""
+    return list(FileLoaderFactory.get_loader_for_file(path).load(path, **kwargs))
 
 
 class FileLoaderFactory:
@@ -156,6 +229,9 @@ class FileLoaderFactory:
         'apache': TextLoader(),
     }
 
+    # Extension -> loader, rebuilt whenever a loader is registered
+    _ext_map: Dict[str, FileLoader] = {}
+
     @classmethod
     def register_loader(cls, format_name: str, loader: FileLoader) -> None:
         """
@@ -167,18 +243,26 @@ class FileLoaderFactory:
 
         Example:
             >>> class XMLLoader(FileLoader):
+            ...     SUPPORTED_EXTENSIONS = ('.xml',)
             ...     def load(self, path, **kwargs):
             ...         # Custom XML loading logic
             ...         pass
-            ...     @property
-            ...     def supported_extensions(self):
-            ...         return ['.xml']
             >>>
             >>> FileLoaderFactory.register_loader('xml', XMLLoader())
         """
         cls._loaders[format_name] = loader
+        cls._rebuild_ext_map()
         logger.info(f"Registered loader for format: {format_name}")
 
+    @classmethod
+    def _rebuild_ext_map(cls) -> None:
+        """Index loaders by extension; the first registered format wins."""
+        ext_map: Dict[str, FileLoader] = {}
+        for loader in cls._loaders.values():
+            for ext in loader.supported_extensions:
+                ext_map.setdefault(ext, loader)
+        cls._ext_map = ext_map
+
     @classmethod
     def get_loader(cls, format_name: str) -> FileLoader:
         """
@@ -229,17 +313,85 @@ class FileLoaderFactory:
         ext = path.suffix.lower()
 
         # Try to find loader by extension
-        for loader in cls._loaders.values():
-            if ext in loader.supported_extensions:
-                logger.debug(f"Auto-detected loader for {ext}: {type(loader).__name__}")
-                return loader
+        loader = cls._ext_map.get(ext)
+        if loader is not None:
+            logger.debug(f"Auto-detected loader for {ext}: {type(loader).__name__}")
+            return loader
 
         # Default to text loader for unknown extensions
         logger.debug(f"No specific loader for {ext}, using TextLoader")
         return cls._loaders['text']
 
     @classmethod
-    def list_supported_formats(cls) -> Dict[str, list[str]]:
+    def load_many(
+        cls,
+        paths: Iterable[str | Path],
+        **kwargs
+    ) -> Iterable[Tuple[Path, Dict[str, Any]]]:
+        """
+        Load events from several files, choosing a loader for each by extension.
+
+        Files are read in the order given. Readahead for all of them is
+        requested before the first one is parsed (on Linux), so the I/O for
+        many small files overlaps with parsing.
+
+        Args:
+            paths: Paths of the files to load
+            **kwargs: Additional parameters passed to each loader
+
+        Yields:
+            (path, event) tuples
+
+        Example:
+            >>> for path, event in FileLoaderFactory.load_many(['a.jsonl', 'b.log']):
+            ...     print(path.name, event.get('message'))
+        """
+        paths = [Path(p) for p in paths]
+        _prefetch(paths)
+
+        for path in paths:
+            loader = cls.get_loader_for_file(path)
+            for event in loader.load(path, **kwargs):
+                yield path, event
+
+    @classmethod
+    def load_many_parallel(
+        cls,
+        paths: Iterable[str | Path],
+        workers: Optional[int] = None,
+        **kwargs
+    ) -> Iterable[Tuple[Path, Dict[str, Any]]]:
+        """
+        Load events from several files using a pool of worker processes.
+
+        Each file is parsed in its own worker, so CPU-bound parsing of many
+        files scales past the GIL. Results are yielded in the order of
+        ``paths``. Each worker returns its file's events as a list, so peak
+        memory is higher than with load_many().
+
+        Loaders added with register_loader() are only seen by workers that
+        are forked from the registering process.
+
+        Args:
+            paths: Paths of the files to load
+            workers: Number of worker processes (defaults to the CPU count)
+            **kwargs: Additional parameters passed to each loader
+
+        Yields:
+            (path, event) tuples
+        """
+        paths = [Path(p) for p in paths]
+        if not paths:
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_load_file, path, kwargs) for path in paths]
+            for path, future in zip(paths, futures):
+                for event in future.result():
+                    yield path, event
+
+    @classmethod
+    def list_supported_formats(cls) -> Dict[str, Sequence[str]]:
         """
         List all supported formats and their file extensions.
 
@@ -257,3 +409,6 @@ class FileLoaderFactory:
         for name, loader in cls._loaders.items():
             formats[name] = loader.supported_extensions
         return formats
+
+
+FileLoaderFactory._rebuild_ext_map()
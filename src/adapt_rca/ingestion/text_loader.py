@@ -4,44 +4,58 @@ Text and syslog file loader.
 import re
 import logging
 from pathlib import Path
+from sys import intern
 from typing import Iterable, Dict, Any, Optional, Pattern
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
 from ..utils import validate_file_size, get_file_size, format_bytes, PathValidationError
 from ..constants import MAX_FILE_SIZE_BYTES
 from ..security.sanitization import validate_regex_safety
 
+try:
+    # RE2 matches in linear time, so patterns cannot backtrack catastrophically
+    import re2 as _regex
+except ImportError:  # pragma: no cover - optional dependency
+    _regex = re
+
 logger = logging.getLogger(__name__)
 
 # Common log patterns
-SYSLOG_PATTERN = re.compile(
+SYSLOG_PATTERN = _regex.compile(
     r'^(?P<timestamp>\w+\s+\d+\s+\d+:\d+:\d+)\s+'
     r'(?P<host>\S+)\s+'
     r'(?P<service>\S+?)(\[(?P<pid>\d+)\])?\s*:\s*'
     r'(?P<message>.+)$'
 )
 
-NGINX_PATTERN = re.compile(
+NGINX_PATTERN = _regex.compile(
     r'^(?P<ip>\S+)\s+-\s+\S+\s+\[(?P<timestamp>[^\]]+)\]\s+'
     r'"(?P<method>\S+)\s+(?P<path>\S+)\s+\S+"\s+'
     r'(?P<status>\d+)\s+(?P<size>\d+)'
 )
 
-APACHE_PATTERN = re.compile(
+APACHE_PATTERN = _regex.compile(
     r'^(?P<ip>\S+)\s+\S+\s+\S+\s+\[(?P<timestamp>[^\]]+)\]\s+'
     r'"(?P<method>\S+)\s+(?P<path>\S+)\s+\S+"\s+'
     r'(?P<status>\d+)\s+(?P<size>\S+)'
 )
 
 # Generic log pattern (timestamp + level + message)
-GENERIC_PATTERN = re.compile(
-    r'^(?P<timestamp>\d{4}-\d{2}-\d{2}[\sT]\d{2}:\d{2}:\d{2}[^\s]*)\s+'
+GENERIC_PATTERN = _regex.compile(
+    r'(?i)^(?P<timestamp>\d{4}-\d{2}-\d{2}[\sT]\d{2}:\d{2}:\d{2}[^\s]*)\s+'
     r'\[?(?P<level>DEBUG|INFO|WARN|WARNING|ERROR|CRITICAL|FATAL)\]?\s*'
     r'(?:\[(?P<service>[^\]]+)\]\s*)?'
-    r'(?P<message>.+)$',
-    re.IGNORECASE
+    r'(?P<message>.+)$'
 )
 
+# Low-cardinality event fields whose values are interned to share storage
+_INTERNED_FIELDS = ("level", "service")
+
+# Patterns tried, in order, when auto-detecting the log format
+_AUTO_PATTERNS = (SYSLOG_PATTERN, GENERIC_PATTERN, NGINX_PATTERN, APACHE_PATTERN)
+
 
 def load_text_log(
     path: str | Path,
@@ -85,23 +99,7 @@ def load_text_log(
 
     # Select pattern
     if custom_pattern:
-        # Validate custom pattern for ReDoS vulnerabilities
-        try:
-            if not validate_regex_safety(custom_pattern, timeout=1.0):
-                raise ValueError(
-                    f"Custom regex pattern appears unsafe (potential ReDoS): {custom_pattern[:50]}"
-                )
-        except ValueError as e:
-            # Re-raise validation errors
-            raise ValueError(f"Unsafe regex pattern: {e}") from e
-        except Exception as e:
-            logger.warning(f"Could not validate regex pattern safety: {e}")
-            # Allow it but log warning
-
-        try:
-            pattern = re.compile(custom_pattern)
-        except re.error as e:
-            raise ValueError(f"Invalid regex pattern: {e}") from e
+        pattern = _compile_custom_pattern(custom_pattern)
     elif log_format == "syslog":
         pattern = SYSLOG_PATTERN
     elif log_format == "nginx":
@@ -113,6 +111,10 @@ def load_text_log(
     else:  # auto
         pattern = None  # Will try multiple patterns
 
+    # In auto mode, the pattern that matched the previous line is tried
+    # first, so a file in a single format costs one match per line
+    last_pattern = _AUTO_PATTERNS[0]
+
     line_number = 0
     parsed_lines = 0
     skipped_lines = 0
@@ -133,17 +135,23 @@ def load_text_log(
                     event = _parse_line_with_pattern(line, pattern)
                 else:
                     # Auto-detect: try multiple patterns
-                    for p in [SYSLOG_PATTERN, GENERIC_PATTERN, NGINX_PATTERN, APACHE_PATTERN]:
-                        event = _parse_line_with_pattern(line, p)
-                        if event:
-                            break
+                    event = _parse_line_with_pattern(line, last_pattern)
+                    if not event:
+                        for p in _AUTO_PATTERNS:
+                            if p is last_pattern:
+                                continue
+                            event = _parse_line_with_pattern(line, p)
+                            if event:
+                                last_pattern = p
+                                break
 
                 if event:
                     parsed_lines += 1
                     yield event
                 else:
                     skipped_lines += 1
-                    if skipped_lines <= 5:  # Log first few unparseable lines
+                    # Log first few unparseable lines
+                    if skipped_lines <= 5 and logger.isEnabledFor(logging.DEBUG):
                         logger.debug(f"Could not parse line {line_number}: {line[:100]}")
 
     except UnicodeDecodeError as e:
@@ -156,6 +164,73 @@ def load_text_log(
     )
 
 
+@dataclass(frozen=True)
+class _PatternMeta:
+    """Which named groups a pattern defines, for post-processing matches."""
+    infer_level: bool
+    has_service: bool
+    has_host: bool
+    has_path: bool
+    has_message: bool
+    has_method_path: bool
+
+
+@lru_cache(maxsize=32)
+def _pattern_meta(pattern: Pattern) -> _PatternMeta:
+    """
+    Get the post-processing flags for a pattern.
+
+    The set of named groups is fixed when a pattern is compiled, so these
+    checks are done once per pattern rather than once per parsed line. The
+    cache is bounded, so one-off custom patterns are eventually released.
+    """
+    groups = pattern.groupindex
+    return _PatternMeta(
+        infer_level='status' in groups and 'level' not in groups,
+        has_service='service' in groups,
+        has_host='host' in groups,
+        has_path='path' in groups,
+        has_message='message' in groups,
+        has_method_path='method' in groups and 'path' in groups,
+    )
+
+
+def _compile_custom_pattern(custom_pattern: str) -> Pattern:
+    """
+    Compile a user-supplied log pattern with the standard re module.
+
+    RE2 is deliberately not used here: its \\w, \\d and \\s classes are
+    ASCII-only, so user patterns would silently stop matching non-ASCII
+    lines depending on whether it is installed.
+
+    Args:
+        custom_pattern: Regex pattern with named groups
+
+    Returns:
+        Compiled pattern
+
+    Raises:
+        ValueError: If the pattern is unsafe or invalid
+    """
+    # Validate custom pattern for ReDoS vulnerabilities
+    try:
+        if not validate_regex_safety(custom_pattern, timeout=1.0):
+            raise ValueError(
+                f"Custom regex pattern appears unsafe (potential ReDoS): {custom_pattern[:50]}"
+            )
+    except ValueError as e:
+        # Re-raise validation errors
+        raise ValueError(f"Unsafe regex pattern: {e}") from e
+    except Exception as e:
+        logger.warning(f"Could not validate regex pattern safety: {e}")
+        # Allow it but log warning
+
+    try:
+        return re.compile(custom_pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern: {e}") from e
+
+
 def _parse_line_with_pattern(line: str, pattern: Pattern) -> Optional[Dict[str, Any]]:
     """
     Parse a log line with the given regex pattern.
@@ -172,9 +247,10 @@ def _parse_line_with_pattern(line: str, pattern: Pattern) -> Optional[Dict[str,
         return None
 
     event = match.groupdict()
+    meta = _pattern_meta(pattern)
 
     # Infer log level from HTTP status codes
-    if 'status' in event and 'level' not in event:
+    if meta.infer_level:
         status = int(event['status'])
         if status >= 500:
             event['level'] = 'ERROR'
@@ -184,22 +260,28 @@ def _parse_line_with_pattern(line: str, pattern: Pattern) -> Optional[Dict[str,
             event['level'] = 'INFO'
 
     # Set service from various possible fields
-    if 'service' not in event or not event['service']:
-        if 'host' in event:
+    if not meta.has_service or not event['service']:
+        if meta.has_host:
             event['service'] = event['host']
-        elif 'path' in event:
+        elif meta.has_path:
             # Use path as service for web logs
             event['service'] = 'web'
 
     # Construct message if not present
-    if 'message' not in event:
-        if 'method' in event and 'path' in event:
+    if not meta.has_message:
+        if meta.has_method_path:
             event['message'] = f"{event.get('method')} {event.get('path')} - {event.get('status')}"
         else:
             # Use the whole line as message
             event['message'] = line
 
     # Remove None values
-    event = {k: v for k, v in event.items() if v is not None}
+    for key in [k for k, v in event.items() if v is None]:
+        del event[key]
+
+    for key in _INTERNED_FIELDS:
+        value = event.get(key)
+        if value is not None:
+            event[key] = intern(value)
 
     return event
@@ -3,16 +3,21 @@ Cloud provider integrations for log ingestion.
 
 Supports pulling logs from AWS CloudWatch, GCP Cloud Logging, and Azure Monitor.
 """
+import asyncio
 import logging
+import re
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Iterator
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CloudLogEntry:
     """Represents a log entry from cloud provider."""
     timestamp: datetime
@@ -24,6 +29,26 @@ class CloudLogEntry:
     raw: Dict[str, Any]
 
 
+def _split_time_range(start_ms: int, end_ms: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split an inclusive millisecond range into non-overlapping inclusive windows.
+
+    Args:
+        start_ms: Range start (inclusive)
+        end_ms: Range end (inclusive)
+        parts: Maximum number of windows
+
+    Returns:
+        List of (start_ms, end_ms) pairs covering the range in order
+    """
+    span = end_ms - start_ms + 1
+    if span <= 0:
+        return [(start_ms, end_ms)]
+    parts = min(parts, span)
+    bounds = [start_ms + span * i // parts for i in range(parts + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(parts)]
+
+
 class CloudIntegration(ABC):
     """Base class for cloud provider integrations."""
 
@@ -47,6 +72,47 @@ class CloudIntegration(ABC):
         """
         pass
 
+    async def fetch_logs_async(
+        self,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[CloudLogEntry]:
+        """
+        Fetch logs without blocking the event loop.
+
+        The provider's fetch_logs() runs in a worker thread, so its blocking
+        HTTP calls overlap with other work on the loop. Entries are pulled
+        across in batches to keep the per-entry thread hand-off cheap.
+
+        Args:
+            start_time: Start of time range
+            end_time: End of time range (defaults to now)
+            filters: Optional filters (provider-specific)
+            batch_size: Number of entries fetched per thread hand-off
+
+        Yields:
+            CloudLogEntry objects, in the same order as fetch_logs()
+
+        Raises:
+            ValueError: If batch_size is not positive
+
+        Example:
+            >>> async for entry in integration.fetch_logs_async(start):
+            ...     print(entry.message)
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        entries = self.fetch_logs(start_time, end_time, filters)
+        while True:
+            batch = await asyncio.to_thread(lambda: list(islice(entries, batch_size)))
+            if not batch:
+                break
+            for entry in batch:
+                yield entry
+
 
 class AWSCloudWatchIntegration(CloudIntegration):
     """
@@ -70,7 +136,8 @@ class AWSCloudWatchIntegration(CloudIntegration):
         log_group: str,
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
-        profile_name: Optional[str] = None
+        profile_name: Optional[str] = None,
+        max_concurrent_queries: int = 1
     ):
         """
         Initialize AWS CloudWatch integration.
@@ -81,9 +148,12 @@ class AWSCloudWatchIntegration(CloudIntegration):
             aws_access_key_id: Optional AWS access key
             aws_secret_access_key: Optional AWS secret key
             profile_name: Optional AWS profile name
+            max_concurrent_queries: Number of time windows to fetch in
+                parallel; 1 fetches the whole range with a single paginator
         """
         self.region = region
         self.log_group = log_group
+        self.max_concurrent_queries = max(1, max_concurrent_queries)
 
         try:
             import boto3
@@ -128,8 +198,57 @@ class AWSCloudWatchIntegration(CloudIntegration):
                 - filter_pattern: CloudWatch Logs filter pattern
 
         Yields:
-            CloudLogEntry objects
+            CloudLogEntry objects, in time-window order when fetched in
+            parallel
         """
+        for events in self._fetch_event_pages(start_time, end_time, filters):
+            yield from self._to_entries(events)
+
+    def fetch_logs_batched(
+        self,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 512
+    ) -> Iterator[List[CloudLogEntry]]:
+        """
+        Fetch logs from CloudWatch in lists of up to batch_size entries.
+
+        Takes the same arguments as fetch_logs() and returns the same
+        entries in the same order, for consumers that process them in bulk.
+
+        Args:
+            start_time: Start of time range
+            end_time: End of time range (defaults to now)
+            filters: Optional filters, as for fetch_logs()
+            batch_size: Maximum number of entries per batch
+
+        Yields:
+            Lists of CloudLogEntry objects; only the last may be shorter
+            than batch_size
+
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        batch: List[CloudLogEntry] = []
+        for events in self._fetch_event_pages(start_time, end_time, filters):
+            batch.extend(self._to_entries(events))
+            while len(batch) >= batch_size:
+                yield batch[:batch_size]
+                del batch[:batch_size]
+        if batch:
+            yield batch
+
+    def _fetch_event_pages(
+        self,
+        start_time: datetime,
+        end_time: Optional[datetime],
+        filters: Optional[Dict[str, Any]]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield lists of raw CloudWatch events (pages, or whole windows)."""
         if end_time is None:
             end_time = datetime.now()
 
@@ -153,49 +272,110 @@ class AWSCloudWatchIntegration(CloudIntegration):
             if 'filter_pattern' in filters:
                 params['filterPattern'] = filters['filter_pattern']
 
-            # Paginate through results
-            paginator = self.client.get_paginator('filter_log_events')
-            page_iterator = paginator.paginate(**params)
-
-            for page in page_iterator:
-                for event in page.get('events', []):
-                    yield CloudLogEntry(
-                        timestamp=datetime.fromtimestamp(event['timestamp'] / 1000),
-                        message=event['message'],
-                        severity=self._extract_severity(event['message']),
-                        source=event.get('logStreamName', 'unknown'),
-                        resource={
-                            'type': 'cloudwatch_log_stream',
-                            'log_group': self.log_group,
-                            'log_stream': event.get('logStreamName', ''),
-                            'region': self.region
-                        },
-                        labels={
-                            'provider': 'aws',
-                            'service': 'cloudwatch'
-                        },
-                        raw=event
+            if self.max_concurrent_queries == 1:
+                # Paginate through results
+                paginator = self.client.get_paginator('filter_log_events')
+                for page in paginator.paginate(**params):
+                    yield page.get('events', [])
+                return
+
+            # Each page is a network round-trip, so split the range into
+            # windows and page through them concurrently. Windows are
+            # yielded in order; later ones are fetched while waiting.
+            windows = _split_time_range(start_ms, end_ms, self.max_concurrent_queries)
+            stop = threading.Event()
+            executor = ThreadPoolExecutor(max_workers=len(windows))
+            try:
+                futures = [
+                    executor.submit(
+                        self._fetch_window, {**params, 'startTime': lo, 'endTime': hi}, stop
                     )
+                    for lo, hi in windows
+                ]
+                for future in futures:
+                    yield future.result()
+            finally:
+                # If the consumer stopped early or a window failed, don't wait
+                # for the other windows: drop queued ones and have running
+                # ones stop after their current page
+                stop.set()
+                executor.shutdown(wait=False, cancel_futures=True)
 
         except Exception as e:
             logger.error(f"Error fetching CloudWatch logs: {e}")
             raise
 
+    def _fetch_window(
+        self,
+        params: Dict[str, Any],
+        stop: Optional[threading.Event] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every raw event in one time window with its own paginator.
+
+        Stops requesting pages once stop is set, returning what it has.
+        """
+        paginator = self.client.get_paginator('filter_log_events')
+        events = []
+        for page in paginator.paginate(**params):
+            events.extend(page.get('events', []))
+            if stop is not None and stop.is_set():
+                break
+        return events
+
+    def _to_entries(self, events: List[Dict[str, Any]]) -> Iterator[CloudLogEntry]:
+        """Convert raw CloudWatch events to CloudLogEntry objects."""
+        # Loop invariants are bound once per page rather than per event
+        from_timestamp = datetime.fromtimestamp
+        extract_severity = self._extract_severity
+        log_group = self.log_group
+        region = self.region
+
+        for event in events:
+            message = event['message']
+            stream = event.get('logStreamName')
+            yield CloudLogEntry(
+                timestamp=from_timestamp(event['timestamp'] / 1000),
+                message=message,
+                severity=extract_severity(message),
+                source='unknown' if stream is None else stream,
+                resource={
+                    'type': 'cloudwatch_log_stream',
+                    'log_group': log_group,
+                    'log_stream': '' if stream is None else stream,
+                    'region': region
+                },
+                labels={
+                    'provider': 'aws',
+                    'service': 'cloudwatch'
+                },
+                raw=event
+            )
+
+    # Severity keywords, matched anywhere in a message in a single scan
+    _SEVERITY_RE = re.compile(r'FATAL|CRITICAL|ERROR|WARN|INFO|DEBUG', re.IGNORECASE)
+    # Keyword -> (rank, severity); the highest-ranked keyword present wins
+    _SEVERITY_MAP = {
+        'FATAL': (4, 'CRITICAL'),
+        'CRITICAL': (4, 'CRITICAL'),
+        'ERROR': (3, 'ERROR'),
+        'WARN': (2, 'WARNING'),
+        'INFO': (1, 'INFO'),
+        'DEBUG': (0, 'DEBUG'),
+    }
+
     def _extract_severity(self, message: str) -> str:
         """Extract severity from log message."""
-        message_upper = message.upper()
-        if 'FATAL' in message_upper or 'CRITICAL' in message_upper:
-            return 'CRITICAL'
-        elif 'ERROR' in message_upper:
-            return 'ERROR'
-        elif 'WARN' in message_upper:
-            return 'WARNING'
-        elif 'INFO' in message_upper:
-            return 'INFO'
-        elif 'DEBUG' in message_upper:
-            return 'DEBUG'
-        else:
-            return 'INFO'
+        best = (-1, 'INFO')
+        for match in self._SEVERITY_RE.finditer(message):
+            # Unicode case-insensitive matching also accepts letters such as
+            # U+0130 that don't uppercase to the ASCII keyword; ignore those
+            found = self._SEVERITY_MAP.get(match.group().upper())
+            if found is not None and found > best:
+                if found[0] == 4:
+                    return found[1]
+                best = found
+        return best[1]
 
 
 class GCPLoggingIntegration(CloudIntegration):
@@ -278,39 +458,43 @@ class GCPLoggingIntegration(CloudIntegration):
         filters = filters or {}
 
         # Build filter string
-        filter_parts = [
-            f'timestamp>="{start_time.isoformat()}"',
+        filter_str = (
+            f'timestamp>="{start_time.isoformat()}" AND '
             f'timestamp<="{end_time.isoformat()}"'
-        ]
+        )
 
         if 'resource_type' in filters:
-            filter_parts.append(f'resource.type="{filters["resource_type"]}"')
+            filter_str += f' AND resource.type="{filters["resource_type"]}"'
 
         if 'log_name' in filters:
-            filter_parts.append(f'logName="{filters["log_name"]}"')
+            filter_str += f' AND logName="{filters["log_name"]}"'
 
         if 'severity' in filters:
-            filter_parts.append(f'severity>={filters["severity"]}')
-
-        filter_str = ' AND '.join(filter_parts)
+            filter_str += f' AND severity>={filters["severity"]}'
 
         try:
             # List log entries
             entries = self.client.list_entries(filter_=filter_str)
 
             for entry in entries:
+                # Entry attributes are converted from protobuf on access, so
+                # read each one once
+                payload = entry.payload
+                log_name = entry.log_name
+                res = entry.resource
+                lbls = entry.labels
                 yield CloudLogEntry(
                     timestamp=entry.timestamp,
-                    message=entry.payload if isinstance(entry.payload, str) else str(entry.payload),
+                    message=payload if isinstance(payload, str) else str(payload),
                     severity=entry.severity or 'INFO',
-                    source=entry.log_name or 'unknown',
+                    source=log_name or 'unknown',
                     resource={
-                        'type': entry.resource.type if entry.resource else 'unknown',
-                        'labels': dict(entry.resource.labels) if entry.resource else {}
+                        'type': res.type if res else 'unknown',
+                        'labels': dict(res.labels) if res else {}
                     },
-                    labels=dict(entry.labels) if entry.labels else {},
+                    labels=dict(lbls) if lbls else {},
                     raw={
-                        'log_name': entry.log_name,
+                        'log_name': log_name,
                         'insert_id': entry.insert_id,
                         'trace': entry.trace,
                         'span_id': entry.span_id
@@ -426,13 +610,16 @@ class AzureMonitorIntegration(CloudIntegration):
             )
 
             if response.status == LogsQueryStatus.SUCCESS:
+                # Timestamp for rows without TimeGenerated
+                fetched_at = datetime.now()
                 for table in response.tables:
+                    column_names = [col.name for col in table.columns]
                     for row in table.rows:
                         # Convert row to dict
-                        row_dict = dict(zip([col.name for col in table.columns], row))
+                        row_dict = dict(zip(column_names, row))
 
                         yield CloudLogEntry(
-                            timestamp=row_dict.get('TimeGenerated', datetime.now()),
+                            timestamp=row_dict.get('TimeGenerated', fetched_at),
                             message=row_dict.get('Message', '') or str(row_dict),
                             severity=row_dict.get('SeverityLevel', 'INFO'),
                             source=row_dict.get('AppRoleName', 'unknown'),
@@ -7,15 +7,40 @@ Helps identify latency issues and trace error propagation across services.
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    # orjson decodes large OTLP JSON payloads several times faster
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only stand-in for missing nested OTLP objects
+_EMPTY: Dict[str, Any] = {}
+# Dividing a timedelta by this gives milliseconds as a float in one step
+_ONE_MS = timedelta(milliseconds=1)
+_ZERO = timedelta(0)
+_start_time = attrgetter('start_time')
 
-@dataclass
+
+@dataclass(slots=True)
 class Span:
-    """Represents an OpenTelemetry span."""
+    """
+    Represents an OpenTelemetry span.
+
+    The duration is computed once at construction, so start_time and
+    end_time should not be changed afterwards.
+    """
     trace_id: str
     span_id: str
     parent_span_id: Optional[str]
@@ -28,11 +53,16 @@ class Span:
     events: List[Dict[str, Any]] = field(default_factory=list)
     status_code: str = "OK"  # OK, ERROR, UNSET
     status_message: Optional[str] = None
+    _duration_ms: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the duration, which analysis reads many times per span."""
+        self._duration_ms = (self.end_time - self.start_time) / _ONE_MS
 
     @property
     def duration_ms(self) -> float:
-        """Calculate span duration in milliseconds."""
-        return (self.end_time - self.start_time).total_seconds() * 1000
+        """Span duration in milliseconds."""
+        return self._duration_ms
 
     @property
     def is_error(self) -> bool:
@@ -40,7 +70,7 @@ class Span:
         return self.status_code == "ERROR"
 
 
-@dataclass
+@dataclass(slots=True)
 class Trace:
     """Represents a complete distributed trace."""
     trace_id: str
@@ -50,31 +80,56 @@ class Trace:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     has_errors: bool = False
+    # span_id -> span (the first span wins if an ID repeats)
+    span_index: Dict[str, Span] = field(init=False, repr=False, compare=False)
+    # parent span_id -> child spans, in span order
+    children_index: Dict[str, List[Span]] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Initialize computed fields."""
-        if self.spans:
-            # Find root span
-            for span in self.spans:
-                if span.parent_span_id is None:
-                    self.root_span = span
-                    break
-
-            # Collect services
-            self.services = {s.service_name for s in self.spans}
-
-            # Calculate time range
-            self.start_time = min(s.start_time for s in self.spans)
-            self.end_time = max(s.end_time for s in self.spans)
-
-            # Check for errors
-            self.has_errors = any(s.is_error for s in self.spans)
+        """Initialize computed fields in a single pass over the spans."""
+        span_index: Dict[str, Span] = {}
+        children_index: Dict[str, List[Span]] = {}
+        self.span_index = span_index
+        self.children_index = children_index
+
+        if not self.spans:
+            return
+
+        root = None
+        services = set()
+        has_errors = False
+        start_time = end_time = None
+        for span in self.spans:
+            span_index.setdefault(span.span_id, span)
+            parent = span.parent_span_id
+            if parent:
+                children = children_index.get(parent)
+                if children is None:
+                    children_index[parent] = [span]
+                else:
+                    children.append(span)
+            elif parent is None and root is None:
+                root = span
+            services.add(span.service_name)
+            if span.status_code == "ERROR":
+                has_errors = True
+            if start_time is None or span.start_time < start_time:
+                start_time = span.start_time
+            if end_time is None or span.end_time > end_time:
+                end_time = span.end_time
+
+        if root is not None:
+            self.root_span = root
+        self.services = services
+        self.start_time = start_time
+        self.end_time = end_time
+        self.has_errors = has_errors
 
     @property
     def total_duration_ms(self) -> float:
         """Total trace duration in milliseconds."""
         if self.start_time and self.end_time:
-            return (self.end_time - self.start_time).total_seconds() * 1000
+            return (self.end_time - self.start_time) / _ONE_MS
         return 0.0
 
     def get_critical_path(self) -> List[Span]:
@@ -87,26 +142,76 @@ class Trace:
         if not self.root_span:
             return []
 
-        # Build parent-child relationships
-        children = defaultdict(list)
-        for span in self.spans:
-            if span.parent_span_id:
-                children[span.parent_span_id].append(span)
-
-        # DFS to find longest path
-        def find_longest_path(span: Span) -> List[Span]:
-            if span.span_id not in children:
-                return [span]
-
-            longest = []
-            for child in children[span.span_id]:
-                path = find_longest_path(child)
-                if sum(s.duration_ms for s in path) > sum(s.duration_ms for s in longest):
-                    longest = path
-
-            return [span] + longest
+        children = self.children_index
+
+        # Longest cumulative duration from each span down to a leaf, and the
+        # child continuing that path. Spans are finished leaves-first with an
+        # explicit stack, so each is evaluated once and deep traces can't hit
+        # the recursion limit. Keyed by id() since span IDs may repeat.
+        best_total: Dict[int, float] = {}
+        best_child: Dict[int, Optional[Span]] = {}
+        started = set()
+        stack = [(self.root_span, False)]
+        while stack:
+            span, expanded = stack.pop()
+            key = id(span)
+            if expanded:
+                total, nxt = 0.0, None
+                for child in children.get(span.span_id, ()):
+                    child_total = best_total.get(id(child))
+                    # Strictly greater, so the first of equal paths wins
+                    if child_total is not None and child_total > total:
+                        total, nxt = child_total, child
+                best_total[key] = span.duration_ms + total
+                best_child[key] = nxt
+            elif key not in started:  # Also breaks parent-link cycles
+                started.add(key)
+                stack.append((span, True))
+                for child in children.get(span.span_id, ()):
+                    stack.append((child, False))
+
+        path = []
+        span = self.root_span
+        while span is not None:
+            path.append(span)
+            span = best_child[id(span)]
+        return path
+
+
+@lru_cache(maxsize=1024)
+def _datetime_from_second(seconds: int) -> datetime:
+    """Local datetime for a whole epoch second (cached)."""
+    return datetime.fromtimestamp(seconds)
+
+
+def _span_from_otlp(
+    span_data: Dict[str, Any],
+    trace_id: str,
+    parse_timestamp: Callable[[int | str], datetime]
+) -> Span:
+    """
+    Build a Span from one OTLP span dict, reading each key once.
 
-        return find_longest_path(self.root_span)
+    Arguments are passed positionally, in Span field order, since this is
+    called once per span on the ingest path.
+    """
+    get = span_data.get
+    resource = get('resource') or _EMPTY
+    status = get('status') or _EMPTY
+    return Span(
+        get('traceId', trace_id),                           # trace_id
+        get('spanId', ''),                                  # span_id
+        get('parentSpanId'),                                # parent_span_id
+        get('name', ''),                                    # name
+        get('kind', 'INTERNAL'),                            # kind
+        parse_timestamp(get('startTimeUnixNano', 0)),       # start_time
+        parse_timestamp(get('endTimeUnixNano', 0)),         # end_time
+        (resource.get('attributes') or _EMPTY).get('service.name', 'unknown'),  # service_name
+        get('attributes', {}),                              # attributes
+        get('events', []),                                  # events
+        status.get('code', 'UNSET'),                        # status_code
+        status.get('message')                               # status_message
+    )
 
 
 class OpenTelemetryAnalyzer:
@@ -147,27 +252,32 @@ class OpenTelemetryAnalyzer:
             Trace object
         """
         trace_id = trace_data.get('traceId', '')
-        spans = []
-
-        for span_data in trace_data.get('spans', []):
-            span = Span(
-                trace_id=span_data.get('traceId', trace_id),
-                span_id=span_data.get('spanId', ''),
-                parent_span_id=span_data.get('parentSpanId'),
-                name=span_data.get('name', ''),
-                kind=span_data.get('kind', 'INTERNAL'),
-                start_time=self._parse_timestamp(span_data.get('startTimeUnixNano', 0)),
-                end_time=self._parse_timestamp(span_data.get('endTimeUnixNano', 0)),
-                service_name=span_data.get('resource', {}).get('attributes', {}).get('service.name', 'unknown'),
-                attributes=span_data.get('attributes', {}),
-                events=span_data.get('events', []),
-                status_code=span_data.get('status', {}).get('code', 'UNSET'),
-                status_message=span_data.get('status', {}).get('message')
-            )
-            spans.append(span)
+        parse_timestamp = self._parse_timestamp
+        spans = [
+            _span_from_otlp(span_data, trace_id, parse_timestamp)
+            for span_data in trace_data.get('spans', ())
+        ]
 
         return Trace(trace_id=trace_id, spans=spans)
 
+    def parse_trace_bytes(self, raw: bytes | str) -> Trace:
+        """
+        Parse an OTLP JSON trace document.
+
+        Decodes with orjson when it is installed, avoiding a separate
+        json.loads step in the caller.
+
+        Args:
+            raw: Trace JSON as bytes or str
+
+        Returns:
+            Trace object
+
+        Raises:
+            ValueError: If raw is not valid JSON
+        """
+        return self.parse_trace(_json_loads(raw))
+
     def analyze_trace(self, trace: Trace) -> List[Dict[str, Any]]:
         """
         Analyze trace for performance and error issues.
@@ -260,23 +370,21 @@ class OpenTelemetryAnalyzer:
         Returns:
             List of propagation steps or None
         """
-        error_spans = sorted(
-            [s for s in trace.spans if s.is_error],
-            key=lambda s: s.start_time
-        )
-
+        error_spans = [s for s in trace.spans if s.status_code == "ERROR"]
         if len(error_spans) < 2:
             return None
+        error_spans.sort(key=_start_time)
 
         # Check if errors occurred in sequence
         propagation = []
-        for i in range(len(error_spans) - 1):
-            current = error_spans[i]
-            next_span = error_spans[i + 1]
-
-            time_diff = (next_span.start_time - current.end_time).total_seconds() * 1000
-
-            if 0 <= time_diff <= self.error_window:
+        window = self.error_window
+        for current, next_span in zip(error_spans, error_spans[1:]):
+            gap = next_span.start_time - current.end_time
+            if gap < _ZERO:
+                continue  # Overlapping spans; skip the float conversion
+
+            time_diff = gap / _ONE_MS
+            if time_diff <= window:
                 propagation.append({
                     'from_service': current.service_name,
                     'to_service': next_span.service_name,
@@ -296,10 +404,7 @@ class OpenTelemetryAnalyzer:
             List of dependency relationships
         """
         dependencies = []
-        service_spans = defaultdict(list)
-
-        for span in trace.spans:
-            service_spans[span.service_name].append(span)
+        span_index = trace.span_index
 
         # Find parent-child service relationships
         seen_deps = set()
@@ -307,7 +412,7 @@ class OpenTelemetryAnalyzer:
         for span in trace.spans:
             if span.parent_span_id:
                 # Find parent span
-                parent = next((s for s in trace.spans if s.span_id == span.parent_span_id), None)
+                parent = span_index.get(span.parent_span_id)
                 if parent and parent.service_name != span.service_name:
                     dep_key = (parent.service_name, span.service_name)
                     if dep_key not in seen_deps:
@@ -320,9 +425,16 @@ class OpenTelemetryAnalyzer:
 
         return dependencies
 
-    def _parse_timestamp(self, nanos: int) -> datetime:
-        """Convert nanoseconds since epoch to datetime."""
-        return datetime.fromtimestamp(nanos / 1e9)
+    def _parse_timestamp(self, nanos: int | str) -> datetime:
+        """
+        Convert nanoseconds since epoch to datetime.
+
+        Uses integer arithmetic, so nanosecond timestamps don't lose
+        precision through a float, and reuses the conversion of the whole
+        second, which is shared by most spans in a trace.
+        """
+        seconds, remainder = divmod(int(nanos), 1_000_000_000)
+        return _datetime_from_second(seconds).replace(microsecond=remainder // 1000)
 
     def aggregate_traces(
         self,
@@ -339,6 +451,9 @@ class OpenTelemetryAnalyzer:
         Returns:
             Dictionary with aggregated statistics
         """
+        if np is not None:
+            return self._aggregate_traces_numpy(traces, group_by)
+
         stats = defaultdict(lambda: {
             'count': 0,
             'error_count': 0,
@@ -376,3 +491,64 @@ class OpenTelemetryAnalyzer:
             }
 
         return result
+
+    def _aggregate_traces_numpy(
+        self,
+        traces: List[Trace],
+        group_by: str
+    ) -> Dict[str, Any]:
+        """
+        NumPy implementation of aggregate_traces().
+
+        Spans are flattened into parallel arrays of group ID, duration and
+        error flag, and every statistic is computed with one grouped
+        reduction. Group IDs are assigned in first-seen order, so the result
+        has the same key order as the pure-Python path.
+        """
+        group_ids: Dict[str, int] = {}
+        ids = []
+        durations = []
+        errors = []
+        for trace in traces:
+            for span in trace.spans:
+                if group_by == "service":
+                    key = span.service_name
+                else:  # operation
+                    key = f"{span.service_name}:{span.name}"
+                ids.append(group_ids.setdefault(key, len(group_ids)))
+                durations.append(span.duration_ms)
+                errors.append(span.is_error)
+
+        if not group_ids:
+            return {}
+
+        n = len(group_ids)
+        ids = np.asarray(ids, dtype=np.intp)
+        durations = np.asarray(durations, dtype=np.float64)
+        errors = np.asarray(errors, dtype=np.bool_)
+
+        counts = np.bincount(ids, minlength=n)
+        error_counts = np.bincount(ids[errors], minlength=n)
+        totals = np.bincount(ids, weights=durations, minlength=n)
+        mins = np.full(n, np.inf)
+        np.minimum.at(mins, ids, durations)
+        maxs = np.zeros(n)
+        np.maximum.at(maxs, ids, durations)
+
+        counts = counts.tolist()
+        error_counts = error_counts.tolist()
+        totals = totals.tolist()
+        mins = mins.tolist()
+        maxs = maxs.tolist()
+
+        return {
+            key: {
+                'count': counts[i],
+                'error_count': error_counts[i],
+                'error_rate': error_counts[i] / counts[i],
+                'avg_duration_ms': totals[i] / counts[i],
+                'min_duration_ms': mins[i],
+                'max_duration_ms': maxs[i]
+            }
+            for key, i in group_ids.items()
+        }
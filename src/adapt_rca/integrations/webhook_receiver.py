@@ -7,14 +7,41 @@ webhooks, and push-based integrations.
 import logging
 import hashlib
 import hmac
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, Optional, Callable, List
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
+
+try:
+    # orjson parses request bodies straight from bytes, several times faster
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _json_loads
+
+try:
+    # Event IDs need no cryptographic strength; XXH3 is many times faster
+    from xxhash import xxh3_64_hexdigest as _event_digest
+except ImportError:  # pragma: no cover - optional dependency
+    def _event_digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()[:16]
 
 logger = logging.getLogger(__name__)
 
 
+def _canonical_json(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a payload to compact, sorted-key JSON.
+
+    Used for event IDs, and for signatures when the raw request body isn't
+    available; senders signing a re-serialized payload must match it.
+    Non-ASCII characters are escaped, so the output is always encodable,
+    even for strings holding lone surrogates.
+    """
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+
+
 @dataclass
 class WebhookEvent:
     """Represents an event received via webhook."""
@@ -51,12 +78,33 @@ class WebhookReceiver:
         ... )
     """
 
-    def __init__(self):
-        """Initialize webhook receiver."""
+    def __init__(self, verify_cache_size: int = 0, max_history: int = 1000):
+        """
+        Initialize webhook receiver.
+
+        Args:
+            verify_cache_size: Number of signature verification results to
+                remember, so redelivered webhooks skip the HMAC; 0 disables
+                the cache
+            max_history: Number of most recent events kept in the history
+        """
         self._handlers: Dict[str, List[Callable]] = defaultdict(list)
-        self._secrets: Dict[str, str] = {}
-        self._event_history: List[WebhookEvent] = []
-        self._max_history = 1000
+        # Secrets are stored encoded, ready to use as HMAC keys
+        self._secrets: Dict[str, bytes] = {}
+        # HMAC-SHA256 objects already keyed with each source's secret;
+        # verification copies one instead of redoing the key setup
+        self._hmac_templates: Dict[str, "hmac.HMAC"] = {}
+        self._max_history = max_history
+        # Oldest first; the oldest event is dropped once the limit is reached
+        self._event_history: "deque[WebhookEvent]" = deque()
+        # The same events split by source, so per-source queries and stats
+        # don't scan the whole history
+        self._history_by_source: Dict[str, "deque[WebhookEvent]"] = {}
+        self._verified_count = 0
+        # (source, signature, payload fingerprint) -> verification result,
+        # least recently used first
+        self._verify_cache: "OrderedDict[tuple, bool]" = OrderedDict()
+        self._verify_cache_size = verify_cache_size
 
     def register_secret(self, source: str, secret: str) -> None:
         """
@@ -66,7 +114,15 @@ class WebhookReceiver:
             source: Webhook source identifier
             secret: Shared secret for HMAC verification
         """
-        self._secrets[source] = secret
+        key = secret.encode()
+        self._secrets[source] = key
+        if key:
+            self._hmac_templates[source] = hmac.new(key, digestmod=hashlib.sha256)
+        else:
+            self._hmac_templates.pop(source, None)  # An empty secret never verifies
+        # Results computed with a previous secret no longer apply
+        for key in [k for k in self._verify_cache if k[0] == source]:
+            del self._verify_cache[key]
         logger.info(f"Registered webhook secret for: {source}")
 
     def on_event(self, source: str):
@@ -90,45 +146,63 @@ class WebhookReceiver:
     def receive(
         self,
         source: str,
-        payload: Dict[str, Any],
+        payload: Optional[Dict[str, Any]],
         headers: Dict[str, str],
-        signature: Optional[str] = None
+        signature: Optional[str] = None,
+        raw_body: Optional[bytes] = None
     ) -> WebhookEvent:
         """
         Process incoming webhook.
 
         Args:
             source: Webhook source identifier
-            payload: Webhook payload data
+            payload: Webhook payload data, or None to parse it from raw_body
+                once the signature has been verified
             headers: HTTP headers
             signature: Optional signature for verification
+            raw_body: Request body exactly as received. Providers such as
+                GitHub and Slack sign these bytes, so when given they are
+                hashed directly instead of re-serializing payload.
 
         Returns:
             WebhookEvent object
 
         Raises:
-            ValueError: If signature verification fails
+            ValueError: If signature verification fails, or raw_body is not
+                valid JSON when payload is None
         """
-        # Generate event ID
-        event_id = self._generate_event_id(source, payload)
+        if payload is None and raw_body is None:
+            raise ValueError("Either payload or raw_body is required")
 
-        # Create event
-        event = WebhookEvent(
-            event_id=event_id,
-            source=source,
-            payload=payload,
-            headers=headers
-        )
+        # Serialized once for both the event ID and signature check
+        payload_bytes = raw_body if raw_body is not None else _canonical_json(payload)
 
         # Verify signature if secret is configured
+        verified = False
         if source in self._secrets:
             if not signature:
                 raise ValueError(f"Signature required for {source}")
 
-            if not self._verify_signature(source, payload, signature):
+            if not self._verify_signature_cached(source, payload_bytes, signature):
                 raise ValueError(f"Invalid signature for {source}")
 
-            event.verified = True
+            verified = True
+
+        # Only parse bodies that passed verification
+        if payload is None:
+            try:
+                payload = _json_loads(raw_body)
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON payload for {source}: {e}") from e
+
+        # Create event
+        event = WebhookEvent(
+            event_id=self._generate_event_id(source, payload_bytes),
+            source=source,
+            payload=payload,
+            headers=headers,
+            verified=verified
+        )
 
         # Add to history
         self._add_to_history(event)
@@ -141,21 +215,54 @@ class WebhookReceiver:
                 except Exception as e:
                     logger.error(f"Handler error for {source}: {e}")
 
-        logger.info(f"Processed webhook from {source}: {event_id}")
+        logger.info(f"Processed webhook from {source}: {event.event_id}")
         return event
 
-    def _generate_event_id(self, source: str, payload: Dict[str, Any]) -> str:
-        """Generate unique event ID."""
-        import json
-        payload_str = json.dumps(payload, sort_keys=True)
+    def _generate_event_id(self, source: str, payload_bytes: bytes) -> str:
+        """
+        Generate unique event ID from the serialized payload.
+
+        The ID only has to be unique, not unforgeable, so a fast
+        non-cryptographic hash is used when xxhash is installed. Signatures
+        keep using HMAC-SHA256.
+        """
         timestamp = datetime.now().isoformat()
-        combined = f"{source}:{timestamp}:{payload_str}"
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+        combined = f"{source}:{timestamp}:".encode() + payload_bytes
+        return _event_digest(combined)
+
+    def _verify_signature_cached(
+        self,
+        source: str,
+        payload_bytes: bytes,
+        signature: str
+    ) -> bool:
+        """
+        Verify a webhook signature, reusing the result for a repeated delivery.
+
+        The cache key holds a BLAKE2b fingerprint of the payload rather than
+        the payload itself, so memory use doesn't grow with payload size.
+        A miss computes the HMAC with _verify_signature().
+        """
+        if self._verify_cache_size <= 0:
+            return self._verify_signature(source, payload_bytes, signature)
+
+        cache = self._verify_cache
+        key = (source, signature, hashlib.blake2b(payload_bytes, digest_size=16).digest())
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+
+        result = self._verify_signature(source, payload_bytes, signature)
+        cache[key] = result
+        if len(cache) > self._verify_cache_size:
+            cache.popitem(last=False)
+        return result
 
     def _verify_signature(
         self,
         source: str,
-        payload: Dict[str, Any],
+        payload_bytes: bytes,
         signature: str
     ) -> bool:
         """
@@ -163,42 +270,55 @@ class WebhookReceiver:
 
         Args:
             source: Webhook source
-            payload: Payload data
+            payload_bytes: Raw request body, or the canonical serialized
+                payload (see _canonical_json)
             signature: Signature to verify
 
         Returns:
             True if signature is valid
         """
-        import json
-
-        secret = self._secrets.get(source)
-        if not secret:
+        template = self._hmac_templates.get(source)
+        if template is None:
             return False
 
-        # Compute expected signature
-        payload_bytes = json.dumps(payload, sort_keys=True).encode()
-        expected = hmac.new(
-            secret.encode(),
-            payload_bytes,
-            hashlib.sha256
-        ).hexdigest()
+        # Compute expected signature from a copy of the pre-keyed state
+        mac = template.copy()
+        mac.update(payload_bytes)
+        expected = mac.digest()
 
         # Handle different signature formats
         # GitHub: "sha256=<signature>"
         if signature.startswith("sha256="):
             signature = signature[7:]
 
+        # Compare raw digests rather than hex strings: half the bytes
+        try:
+            provided = bytes.fromhex(signature)
+        except ValueError:
+            return False
+
         # Constant-time comparison
-        return hmac.compare_digest(expected, signature)
+        return hmac.compare_digest(expected, provided)
 
     def _add_to_history(self, event: WebhookEvent) -> None:
         """Add event to history with size limit."""
-        self._event_history.append(event)
+        if self._max_history <= 0:
+            return
+
+        if len(self._event_history) >= self._max_history:
+            # The oldest event overall is also the oldest of its source
+            oldest = self._event_history.popleft()
+            source_history = self._history_by_source[oldest.source]
+            source_history.popleft()
+            if not source_history:
+                del self._history_by_source[oldest.source]
+            if oldest.verified:
+                self._verified_count -= 1
 
-        if len(self._event_history) > self._max_history:
-            # Remove oldest 10%
-            remove_count = self._max_history // 10
-            self._event_history = self._event_history[remove_count:]
+        self._event_history.append(event)
+        self._history_by_source.setdefault(event.source, deque()).append(event)
+        if event.verified:
+            self._verified_count += 1
 
     def get_history(
         self,
@@ -213,14 +333,15 @@ class WebhookReceiver:
             limit: Maximum number of events to return
 
         Returns:
-            List of webhook events
+            List of webhook events, most recently received first
         """
-        events = self._event_history
-
+        # History is kept in arrival order, so newest-first needs no sort
         if source:
-            events = [e for e in events if e.source == source]
+            events = self._history_by_source.get(source, ())
+        else:
+            events = self._event_history
 
-        return sorted(events, key=lambda e: e.received_at, reverse=True)[:limit]
+        return list(islice(reversed(events), max(limit, 0)))
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -229,18 +350,13 @@ class WebhookReceiver:
         Returns:
             Dictionary with webhook stats
         """
-        source_counts = defaultdict(int)
-        verified_count = 0
-
-        for event in self._event_history:
-            source_counts[event.source] += 1
-            if event.verified:
-                verified_count += 1
-
         return {
             "total_events": len(self._event_history),
-            "verified_events": verified_count,
-            "by_source": dict(source_counts),
+            "verified_events": self._verified_count,
+            "by_source": {
+                source: len(events)
+                for source, events in self._history_by_source.items()
+            },
             "registered_sources": list(self._secrets.keys())
         }
 
@@ -270,7 +386,9 @@ def create_webhook_app(receiver: WebhookReceiver, secret_key: str = None):
     def handle_webhook(source):
         """Handle incoming webhook."""
         try:
-            payload = request.get_json()
+            # The raw body is what senders sign; receive() parses it only
+            # after the signature checks out
+            raw_body = request.get_data(cache=False)
             headers = dict(request.headers)
 
             # Get signature from various header names
@@ -282,9 +400,10 @@ def create_webhook_app(receiver: WebhookReceiver, secret_key: str = None):
 
             event = receiver.receive(
                 source=source,
-                payload=payload,
+                payload=None,
                 headers=headers,
-                signature=signature
+                signature=signature,
+                raw_body=raw_body
             )
 
             return jsonify({
@@ -144,7 +144,7 @@ class IncidentGroup(BaseModel):
     severity: Optional[str] = None
 
     @classmethod
-    def from_events(cls, events: List[Event]) -> 'IncidentGroup':
+    def from_events(cls, events: List[Event], presorted: bool = False) -> 'IncidentGroup':
         """Create incident group from list of events.
 
         Aggregates events into a group, calculating time range, affected services,
@@ -152,6 +152,9 @@ class IncidentGroup(BaseModel):
 
         Args:
             events: List of Event objects to group together.
+            presorted: Set when every event has a timestamp and the list is
+                already in chronological order; the time range is then taken
+                from the first and last events instead of scanning for min/max.
 
         Returns:
             IncidentGroup with aggregated information.
@@ -165,7 +168,12 @@ class IncidentGroup(BaseModel):
         if not events:
             return cls()
 
-        timestamps = [e.timestamp for e in events if e.timestamp]
+        if presorted:
+            start_time, end_time = events[0].timestamp, events[-1].timestamp
+        else:
+            timestamps = [e.timestamp for e in events if e.timestamp]
+            start_time = min(timestamps) if timestamps else None
+            end_time = max(timestamps) if timestamps else None
         services = list({e.service for e in events if e.service})
 
         # Determine highest severity
@@ -180,8 +188,8 @@ class IncidentGroup(BaseModel):
 
         return cls(
             events=events,
-            start_time=min(timestamps) if timestamps else None,
-            end_time=max(timestamps) if timestamps else None,
+            start_time=start_time,
+            end_time=end_time,
             services=services,
             severity=severity
         )
@@ -18,7 +18,7 @@ Example:
     >>> print(f"Found {len(incidents)} incidents")
 """
 from typing import List, Dict, Any
-from datetime import timedelta
+from datetime import datetime, timezone
 import logging
 
 from ..models import Event, IncidentGroup
@@ -26,6 +26,17 @@ from ..models import Event, IncidentGroup
 logger = logging.getLogger(__name__)
 
 
+def _epoch_seconds(ts: datetime) -> float:
+    """Return seconds since the epoch, treating naive datetimes as UTC.
+
+    Naive timestamps are pinned to UTC so differences between them match
+    plain datetime subtraction (no local-time DST shifts).
+    """
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
 def simple_grouping(events: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
     """Very basic grouping: put all events into a single incident candidate.
 
@@ -95,9 +106,11 @@ def time_window_grouping(
     if not events:
         return []
 
-    # Filter out events without timestamps
-    events_with_time = [e for e in events if e.timestamp is not None]
-    events_without_time = [e for e in events if e.timestamp is None]
+    # Partition events by whether they have a timestamp in a single pass
+    events_with_time: List[Event] = []
+    events_without_time: List[Event] = []
+    for e in events:
+        (events_without_time if e.timestamp is None else events_with_time).append(e)
 
     if events_without_time:
         logger.warning(
@@ -115,17 +128,20 @@ def time_window_grouping(
 
     groups: List[List[Event]] = []
     current_group: List[Event] = []
-    window_delta = timedelta(minutes=window_minutes)
+    # Compare plain float seconds rather than allocating a timedelta per event
+    window_seconds = window_minutes * 60
+    last_seconds = 0.0
 
     for event in sorted_events:
+        event_seconds = _epoch_seconds(event.timestamp)
         if not current_group:
             # Start new group
             current_group.append(event)
         else:
             # Check if event is within time window of the last event in group
-            time_diff = event.timestamp - current_group[-1].timestamp
+            time_diff = event_seconds - last_seconds
 
-            if time_diff <= window_delta:
+            if time_diff <= window_seconds:
                 # Add to current group
                 current_group.append(event)
             else:
@@ -133,17 +149,19 @@ def time_window_grouping(
                 if len(current_group) >= min_events:
                     groups.append(current_group)
                 current_group = [event]
+        last_seconds = event_seconds
 
     # Add final group
     if current_group and len(current_group) >= min_events:
         groups.append(current_group)
 
+    # Convert to IncidentGroup objects; the timed groups are already in
+    # chronological order
+    incident_groups = [IncidentGroup.from_events(g, presorted=True) for g in groups]
+
     # Add events without timestamps as a separate group if enough
     if events_without_time and len(events_without_time) >= min_events:
-        groups.append(events_without_time)
-
-    # Convert to IncidentGroup objects
-    incident_groups = [IncidentGroup.from_events(g) for g in groups]
+        incident_groups.append(IncidentGroup.from_events(events_without_time))
 
     logger.info(
         f"Grouped {len(events)} events into {len(incident_groups)} incidents "
@@ -7,8 +7,17 @@ __all__ = [
     "export_json",
     "export_markdown",
     "export_graph_mermaid",
-    "export_graph_dot"
+    "export_graph_dot",
+    "iter_graph_mermaid",
+    "iter_graph_dot"
 ]
 
 from .formatter import format_human_readable
-from .exporters import export_json, export_markdown, export_graph_mermaid, export_graph_dot
+from .exporters import (
+    export_json,
+    export_markdown,
+    export_graph_mermaid,
+    export_graph_dot,
+    iter_graph_mermaid,
+    iter_graph_dot,
+)
@@ -9,6 +9,8 @@ Functions:
     export_markdown: Export results to Markdown report.
     export_graph_mermaid: Export causal graph as Mermaid diagram.
     export_graph_dot: Export causal graph as Graphviz DOT format.
+    iter_graph_mermaid: Yield Mermaid diagram lines one at a time.
+    iter_graph_dot: Yield Graphviz DOT lines one at a time.
 
 Example:
     >>> from adapt_rca.reporting.exporters import export_json, export_markdown
@@ -16,7 +18,7 @@ Example:
     >>> export_json(result, "output/analysis.json")
     >>> export_markdown(result, "output/report.md")
 """
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, TextIO
 import json
 import logging
 from pathlib import Path
@@ -25,6 +27,31 @@ from ..utils import validate_output_path, PathValidationError
 
 logger = logging.getLogger(__name__)
 
+# Characters Mermaid doesn't accept in node IDs
+_MERMAID_ID_TABLE = str.maketrans({"-": "_", ".": "_"})
+# Quotes must be escaped inside quoted DOT IDs
+_DOT_ID_TABLE = str.maketrans({'"': '\\"'})
+
+# Line templates for the graph exporters
+_MERMAID_NODE = '    %s["%s<br/>Errors: %s"]'
+_MERMAID_EDGE = '    %s -->|"%.2f"| %s'
+_MERMAID_EDGE_DT = '    %s -->|"%.2f<br/>%.0fs"| %s'
+_DOT_NODE = '    "%s" [label="%s\\nErrors: %s"];'
+_DOT_ROOT_NODE = '    "%s" [label="%s\\nErrors: %s", style=filled, fillcolor=lightcoral];'
+_DOT_EDGE = '    "%s" -> "%s" [label="conf: %.2f"];'
+_DOT_EDGE_DT = '    "%s" -> "%s" [label="conf: %.2f\\n%.0fs"];'
+
+
+def _write_lines(f: TextIO, lines: Iterable[str]) -> None:
+    """Write lines separated by newlines, without a trailing newline."""
+    it = iter(lines)
+    for line in it:
+        f.write(line)
+        break
+    for line in it:
+        f.write("\n")
+        f.write(line)
+
 
 def export_json(result: Dict[str, Any], output_path: str | Path) -> None:
     """Export analysis results to JSON format.
@@ -142,6 +169,42 @@ def export_markdown(result: Dict[str, Any], output_path: str | Path) -> None:
         raise
 
 
+def iter_graph_mermaid(causal_graph_dict: Dict[str, Any]) -> Iterator[str]:
+    """Yield the lines of a Mermaid diagram for a causal graph.
+
+    Lines are produced one at a time (without newlines) so large graphs can
+    be written out without building the whole diagram in memory.
+
+    Args:
+        causal_graph_dict: Causal graph dictionary, as accepted by
+            export_graph_mermaid().
+
+    Yields:
+        Mermaid source lines.
+
+    Example:
+        >>> print("\\n".join(iter_graph_mermaid(graph.to_dict())))
+    """
+    yield "graph TD"
+
+    # Sanitised IDs are computed once per node and reused for its edges
+    safe_ids: Dict[str, str] = {}
+
+    # Add nodes
+    for node in causal_graph_dict.get('nodes', []):
+        node_id = safe_ids[node['id']] = node['id'].translate(_MERMAID_ID_TABLE)
+        yield _MERMAID_NODE % (node_id, node['id'], node['error_count'])
+
+    # Add edges
+    for edge in causal_graph_dict.get('edges', []):
+        from_id = safe_ids.get(edge['from']) or edge['from'].translate(_MERMAID_ID_TABLE)
+        to_id = safe_ids.get(edge['to']) or edge['to'].translate(_MERMAID_ID_TABLE)
+        if edge.get('time_delta_seconds'):
+            yield _MERMAID_EDGE_DT % (from_id, edge['confidence'], edge['time_delta_seconds'], to_id)
+        else:
+            yield _MERMAID_EDGE % (from_id, edge['confidence'], to_id)
+
+
 def export_graph_mermaid(
     causal_graph_dict: Dict[str, Any],
     output_path: str | Path
@@ -178,31 +241,57 @@ def export_graph_mermaid(
         allowed_extensions={'.mmd', '.mermaid'}
     )
 
-    # Reconstruct basic graph from dict
-    lines = ["graph TD"]
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            _write_lines(f, iter_graph_mermaid(causal_graph_dict))
+        logger.info(f"Exported Mermaid diagram to: {path}")
+    except Exception as e:
+        logger.error(f"Failed to export Mermaid: {e}")
+        raise
+
+
+def iter_graph_dot(causal_graph_dict: Dict[str, Any]) -> Iterator[str]:
+    """Yield the lines of a Graphviz DOT diagram for a causal graph.
+
+    Lines are produced one at a time (without newlines) so large graphs can
+    be written out without building the whole diagram in memory.
+
+    Args:
+        causal_graph_dict: Causal graph dictionary, as accepted by
+            export_graph_dot().
+
+    Yields:
+        DOT source lines.
+
+    Example:
+        >>> print("\\n".join(iter_graph_dot(graph.to_dict())))
+    """
+    yield "digraph CausalGraph {"
+    yield "    rankdir=LR;"
+    yield "    node [shape=box];"
+
+    # Get root causes
+    root_causes = set(causal_graph_dict.get('root_causes', []))
+
+    # Escaped IDs are computed once per node and reused for its edges
+    safe_ids: Dict[str, str] = {}
 
     # Add nodes
     for node in causal_graph_dict.get('nodes', []):
-        node_id = node['id'].replace("-", "_").replace(".", "_")
-        label = f"{node['id']}<br/>Errors: {node['error_count']}"
-        lines.append(f"    {node_id}[\"{label}\"]")
+        node_id = safe_ids[node['id']] = node['id'].translate(_DOT_ID_TABLE)
+        template = _DOT_ROOT_NODE if node['id'] in root_causes else _DOT_NODE
+        yield template % (node_id, node['id'], node['error_count'])
 
     # Add edges
     for edge in causal_graph_dict.get('edges', []):
-        from_id = edge['from'].replace("-", "_").replace(".", "_")
-        to_id = edge['to'].replace("-", "_").replace(".", "_")
-        label = f"{edge['confidence']:.2f}"
+        from_id = safe_ids.get(edge['from']) or edge['from'].translate(_DOT_ID_TABLE)
+        to_id = safe_ids.get(edge['to']) or edge['to'].translate(_DOT_ID_TABLE)
         if edge.get('time_delta_seconds'):
-            label += f"<br/>{edge['time_delta_seconds']:.0f}s"
-        lines.append(f"    {from_id} -->|\"{label}\"| {to_id}")
+            yield _DOT_EDGE_DT % (from_id, to_id, edge['confidence'], edge['time_delta_seconds'])
+        else:
+            yield _DOT_EDGE % (from_id, to_id, edge['confidence'])
 
-    try:
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
-        logger.info(f"Exported Mermaid diagram to: {path}")
-    except Exception as e:
-        logger.error(f"Failed to export Mermaid: {e}")
-        raise
+    yield "}"
 
 
 def export_graph_dot(
@@ -243,39 +332,9 @@ def export_graph_dot(
         allowed_extensions={'.dot', '.gv'}
     )
 
-    lines = ["digraph CausalGraph {"]
-    lines.append("    rankdir=LR;")
-    lines.append("    node [shape=box];")
-
-    # Get root causes
-    root_causes = set(causal_graph_dict.get('root_causes', []))
-
-    # Add nodes
-    for node in causal_graph_dict.get('nodes', []):
-        node_id = node['id'].replace('"', '\\"')
-        label = f"{node['id']}\\nErrors: {node['error_count']}"
-
-        if node['id'] in root_causes:
-            lines.append(
-                f'    "{node_id}" [label="{label}", style=filled, fillcolor=lightcoral];'
-            )
-        else:
-            lines.append(f'    "{node_id}" [label="{label}"];')
-
-    # Add edges
-    for edge in causal_graph_dict.get('edges', []):
-        from_id = edge['from'].replace('"', '\\"')
-        to_id = edge['to'].replace('"', '\\"')
-        label = f"conf: {edge['confidence']:.2f}"
-        if edge.get('time_delta_seconds'):
-            label += f"\\n{edge['time_delta_seconds']:.0f}s"
-        lines.append(f'    "{from_id}" -> "{to_id}" [label="{label}"];')
-
-    lines.append("}")
-
     try:
         with open(path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
+            _write_lines(f, iter_graph_dot(causal_graph_dict))
         logger.info(f"Exported DOT diagram to: {path}")
     except Exception as e:
         logger.error(f"Failed to export DOT: {e}")
@@ -0,0 +1,56 @@
+"""
+Tests for the causal graph.
+"""
+from src.adapt_rca.graph.causal_graph import CausalGraph
+
+
+def test_duplicate_edge_ignored():
+    """Test that adding the same edge twice keeps a single edge."""
+    graph = CausalGraph()
+    graph.add_node("api")
+    graph.add_node("db")
+
+    graph.add_edge("api", "db", evidence=["first"])
+    graph.add_edge("api", "db", evidence=["second"])
+
+    assert graph.to_dict()["edges"] == [{"from": "api", "to": "db", "evidence": ["first"]}]
+
+
+def test_reverse_edge_is_distinct():
+    """Test that edges are directed."""
+    graph = CausalGraph()
+    graph.add_node("api")
+    graph.add_node("db")
+
+    graph.add_edge("api", "db")
+    graph.add_edge("db", "api")
+
+    assert len(graph.to_dict()["edges"]) == 2
+
+
+def test_nodes_keep_insertion_order():
+    """Test nodes are exported in the order they were added."""
+    graph = CausalGraph()
+    for node_id in ("db", "api", "cache"):
+        graph.add_node(node_id)
+
+    assert [n["id"] for n in graph.to_dict()["nodes"]] == ["db", "api", "cache"]
+    assert graph.get_node("api") == {"id": "api", "metadata": {}}
+
+
+def test_adjacency_queries():
+    """Test edge lookup helpers."""
+    graph = CausalGraph()
+    for node_id in ("api", "db", "cache"):
+        graph.add_node(node_id)
+
+    graph.add_edge("api", "db")
+    graph.add_edge("api", "cache")
+    graph.add_edge("db", "cache")
+
+    assert graph.has_edge("api", "db")
+    assert not graph.has_edge("db", "api")
+    assert not graph.has_edge("missing", "api")
+    assert graph.neighbors("api") == ["db", "cache"]
+    assert graph.neighbors("cache") == []
+    assert graph.edge_count() == 3
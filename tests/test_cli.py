@@ -0,0 +1,45 @@
+"""
+Tests for command line argument parsing.
+"""
+import pytest
+
+from src.adapt_rca.cli import _parse_args
+
+
+def test_parse_args_input_only():
+    """Test the fast path with only --input."""
+    args = _parse_args(["--input", "logs.jsonl"])
+
+    assert args.input == "logs.jsonl"
+    assert args.output is None
+
+
+def test_parse_args_input_and_output():
+    """Test --input and --output, including the --flag=value form."""
+    args = _parse_args(["--input=logs.jsonl", "--output", "out.json"])
+
+    assert args.input == "logs.jsonl"
+    assert args.output == "out.json"
+
+
+def test_parse_args_missing_input_exits():
+    """Test that a missing --input falls back to argparse's error handling."""
+    with pytest.raises(SystemExit) as exc_info:
+        _parse_args(["--output", "out.json"])
+
+    assert exc_info.value.code == 2
+
+
+def test_parse_args_unknown_flag_exits():
+    """Test that unknown flags are rejected like argparse would."""
+    with pytest.raises(SystemExit):
+        _parse_args(["--input", "logs.jsonl", "--bogus"])
+
+
+def test_parse_args_version(capsys):
+    """Test that --version is still handled by argparse."""
+    with pytest.raises(SystemExit) as exc_info:
+        _parse_args(["--version"])
+
+    assert exc_info.value.code == 0
+    assert "ADAPT-RCA" in capsys.readouterr().out
@@ -0,0 +1,218 @@
+"""
+Tests for cloud provider integrations.
+"""
+import asyncio
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.adapt_rca.integrations.cloud_providers import (
+    AWSCloudWatchIntegration,
+    GCPLoggingIntegration,
+)
+
+
+@pytest.mark.parametrize("message,expected", [
+    ("all good", "INFO"),
+    ("debug: cache miss", "DEBUG"),
+    ("Info: retrying after error", "ERROR"),
+    ("WARNING disk at 91%", "WARNING"),
+    ("fatal: out of memory", "CRITICAL"),
+    ("Critical section entered, no errors", "CRITICAL"),
+    ("\u0130nfo: started", "INFO"),
+    ("CR\u0130TICAL failure, error code 3", "ERROR"),
+])
+def test_cloudwatch_extract_severity(message, expected):
+    """Test the highest-ranked keyword in the message sets the severity."""
+    # Skip __init__, which needs boto3 and AWS credentials
+    integration = object.__new__(AWSCloudWatchIntegration)
+
+    assert integration._extract_severity(message) == expected
+
+
+class _FakePaginator:
+    def __init__(self, events):
+        self.events = events
+
+    def paginate(self, startTime, endTime, **params):
+        hits = [e for e in self.events if startTime <= e["timestamp"] <= endTime]
+        # Two events per page
+        for i in range(0, len(hits), 2):
+            yield {"events": hits[i:i + 2]}
+
+
+class _FakeLogsClient:
+    def __init__(self, events):
+        self.events = events
+
+    def get_paginator(self, name):
+        assert name == "filter_log_events"
+        return _FakePaginator(self.events)
+
+
+@pytest.mark.parametrize("concurrency", [1, 3, 50])
+def test_cloudwatch_fetch_logs_windows(concurrency):
+    """Test sharded fetching returns every event once, in time order."""
+    integration = object.__new__(AWSCloudWatchIntegration)
+    integration.region = "us-east-1"
+    integration.log_group = "/app"
+    integration.max_concurrent_queries = concurrency
+    events = [
+        {"timestamp": ts, "message": f"ERROR {ts}", "logStreamName": "s"}
+        for ts in (1_000, 1_001, 1_010, 1_020, 1_030, 1_039)
+    ]
+    integration.client = _FakeLogsClient(events)
+
+    entries = list(integration.fetch_logs(
+        datetime.fromtimestamp(1.0), datetime.fromtimestamp(1.039)
+    ))
+
+    assert [e.raw["timestamp"] for e in entries] == [e["timestamp"] for e in events]
+    assert entries[0].severity == "ERROR"
+
+
+def test_fetch_logs_async_preserves_order():
+    """Test the async wrapper yields every entry from fetch_logs in order."""
+    integration = object.__new__(AWSCloudWatchIntegration)
+    integration.region = "us-east-1"
+    integration.log_group = "/app"
+    integration.max_concurrent_queries = 1
+    events = [{"timestamp": 1_000 + i, "message": f"m{i}"} for i in range(7)]
+    integration.client = _FakeLogsClient(events)
+
+    async def collect():
+        return [
+            e.message
+            async for e in integration.fetch_logs_async(
+                datetime.fromtimestamp(1.0), datetime.fromtimestamp(1.01), batch_size=3
+            )
+        ]
+
+    assert asyncio.run(collect()) == [f"m{i}" for i in range(7)]
+
+
+def test_fetch_logs_async_rejects_non_positive_batch_size():
+    """Test batch_size is validated like fetch_logs_batched."""
+    integration = object.__new__(AWSCloudWatchIntegration)
+
+    async def first():
+        return await integration.fetch_logs_async(datetime.now(), batch_size=0).__anext__()
+
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        asyncio.run(first())
+
+
+class _FakeGCPClient:
+    def __init__(self, entries):
+        self.entries = entries
+        self.filter = None
+
+    def list_entries(self, filter_):
+        self.filter = filter_
+        return iter(self.entries)
+
+
+def test_gcp_fetch_logs_filter_and_entries():
+    """Test the GCP filter string and conversion of entries with and without a resource."""
+    integration = object.__new__(GCPLoggingIntegration)
+    integration.project_id = "proj"
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 2)
+    raw = dict(timestamp=start, severity=None, insert_id="i", trace=None, span_id=None)
+    integration.client = _FakeGCPClient([
+        SimpleNamespace(
+            payload="boom", log_name="app", labels={"k": "v"},
+            resource=SimpleNamespace(type="gce_instance", labels={"zone": "z"}), **raw
+        ),
+        SimpleNamespace(payload={"a": 1}, log_name=None, labels=None, resource=None, **raw),
+        SimpleNamespace(
+            payload="x", log_name="app", labels=None,
+            resource=SimpleNamespace(type="", labels={}), **raw
+        ),
+    ])
+
+    entries = list(integration.fetch_logs(start, end, filters={"severity": "ERROR"}))
+
+    assert integration.client.filter == (
+        'timestamp>="2024-01-01T00:00:00" AND timestamp<="2024-01-02T00:00:00" '
+        'AND severity>=ERROR'
+    )
+    assert entries[0].resource == {"type": "gce_instance", "labels": {"zone": "z"}}
+    assert entries[0].labels == {"k": "v"}
+    assert entries[1].resource == {"type": "unknown", "labels": {}}
+    assert (entries[1].message, entries[1].source) == ("{'a': 1}", "unknown")
+    assert entries[2].resource["type"] == ""  # An empty type is kept as-is
+
+
+def test_cloudwatch_fetch_logs_batched():
+    """Test batches hold the same entries as fetch_logs, split at batch_size across pages."""
+    integration = object.__new__(AWSCloudWatchIntegration)
+    integration.region = "us-east-1"
+    integration.log_group = "/app"
+    integration.max_concurrent_queries = 1
+    events = [{"timestamp": 1_000 + i, "message": f"m{i}"} for i in range(7)]
+    integration.client = _FakeLogsClient(events)
+    start, end = datetime.fromtimestamp(1.0), datetime.fromtimestamp(1.01)
+
+    batches = list(integration.fetch_logs_batched(start, end, batch_size=3))
+
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert [e.message for b in batches for e in b] == [
+        e.message for e in integration.fetch_logs(start, end)
+    ]
+    with pytest.raises(ValueError):
+        next(integration.fetch_logs_batched(start, end, batch_size=0))
+
+
+def test_cloudwatch_fetch_logs_close_does_not_wait_for_windows():
+    """Test closing the generator early doesn't wait for other windows, which then stop."""
+    release = threading.Event()
+    slow_started = threading.Event()
+    slow_done = threading.Event()
+    closed = threading.Event()
+    slow_pages = []
+
+    class _BlockingPaginator:
+        def paginate(self, startTime, endTime, **params):
+            for page in range(5):
+                if startTime > 1_000:  # The second window blocks until released
+                    slow_started.set()
+                    release.wait()
+                    slow_pages.append(page)
+                yield {"events": [{"timestamp": startTime, "message": f"p{page}"}]}
+
+    integration = object.__new__(AWSCloudWatchIntegration)
+    integration.region = "us-east-1"
+    integration.log_group = "/app"
+    integration.max_concurrent_queries = 2
+    integration.client = SimpleNamespace(get_paginator=lambda name: _BlockingPaginator())
+    fetch_window = integration._fetch_window
+
+    def tracked_fetch_window(params, stop=None):
+        try:
+            return fetch_window(params, stop)
+        finally:
+            if params["startTime"] > 1_000:
+                slow_done.set()
+
+    integration._fetch_window = tracked_fetch_window
+
+    entries = integration.fetch_logs(datetime.fromtimestamp(1.0), datetime.fromtimestamp(1.009))
+    assert next(entries).message == "p0"
+    assert slow_started.wait(10)
+
+    # close() must return while the second window is still blocked; the
+    # timeouts only guard against hanging the test run
+    closer = threading.Thread(target=lambda: (entries.close(), closed.set()))
+    closer.start()
+    try:
+        assert closed.wait(10)
+        assert not slow_done.is_set()
+    finally:
+        release.set()
+        closer.join(10)
+
+    assert slow_done.wait(10)
+    # The slow window stopped after the page it was fetching
+    assert slow_pages == [0]
@@ -0,0 +1,313 @@
+"""
+Tests for configuration file loading and merging.
+"""
+import os
+
+import pytest
+
+from src.adapt_rca import config_loader
+from src.adapt_rca.exceptions import InvalidConfigError
+from src.adapt_rca.config_loader import (
+    clear_config_cache,
+    deep_merge,
+    find_config_file,
+    flatten_config,
+    get_env_config,
+    load_config_with_overrides,
+    merge_config,
+    load_config_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache(monkeypatch):
+    for name in list(os.environ):
+        if name.startswith("ADAPT_RCA_"):
+            monkeypatch.delenv(name)
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+def test_load_yaml_config(tmp_path):
+    """Test loading a YAML config file."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_text("llm:\n  provider: openai\n  timeout: 10\n")
+
+    config = load_config_file(str(path))
+
+    assert config == {"llm": {"provider": "openai", "timeout": 10}}
+
+
+def test_load_toml_config(tmp_path):
+    """Test loading a TOML config file."""
+    path = tmp_path / "adapt-rca.toml"
+    path.write_text('[processing]\nmax_events = 100\n')
+
+    config = load_config_file(str(path))
+
+    assert config == {"processing": {"max_events": 100}}
+
+
+def test_load_config_file_unsupported_suffix(tmp_path):
+    """Test that unknown extensions are rejected."""
+    path = tmp_path / "adapt-rca.ini"
+    path.write_text("[llm]\n")
+
+    with pytest.raises(ValueError, match="Unsupported config file format"):
+        load_config_file(str(path))
+
+
+def test_load_config_file_cached(tmp_path):
+    """Test that an unchanged file is served from the cache."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_text("llm:\n  provider: openai\n")
+    load_config_file(str(path))
+
+    key = str(path.resolve())
+    mtime_ns, size, _ = config_loader._FILE_CACHE[key]
+    config_loader._FILE_CACHE[key] = (mtime_ns, size, {"cached": True})
+
+    assert load_config_file(str(path)) == {"cached": True}
+
+
+def test_load_config_file_cache_returns_copy(tmp_path):
+    """Test that mutating a returned config does not affect the cache."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_text("llm:\n  provider: openai\n")
+
+    config = load_config_file(str(path))
+    config["llm"]["provider"] = "mutated"
+
+    assert load_config_file(str(path))["llm"]["provider"] == "openai"
+
+
+def test_load_config_file_cache_invalidated_on_change(tmp_path):
+    """Test that a modified file is re-parsed."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_text("llm:\n  provider: openai\n")
+    load_config_file(str(path))
+
+    path.write_text("llm:\n  provider: anthropic\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert load_config_file(str(path))["llm"]["provider"] == "anthropic"
+
+
+def test_load_config_file_writes_sidecar(tmp_path):
+    """Test that a JSON sidecar is written and used by a fresh process."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_text("llm:\n  provider: openai\n")
+    load_config_file(str(path))
+
+    sidecar = tmp_path / "adapt-rca.yaml.cache.json"
+    assert sidecar.exists()
+
+    # Simulate a new process: empty in-memory cache, sidecar still valid
+    header = sidecar.read_text().splitlines()[0]
+    sidecar.write_text(header + '\n{"from": "sidecar"}')
+    clear_config_cache()
+
+    assert load_config_file(str(path)) == {"from": "sidecar"}
+
+
+def test_load_config_file_ignores_stale_sidecar(tmp_path):
+    """Test that a sidecar for a different file version is ignored."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_text("llm:\n  provider: openai\n")
+    (tmp_path / "adapt-rca.yaml.cache.json").write_text(
+        '# src-mtime:0 size:0\n{"from": "sidecar"}'
+    )
+
+    assert load_config_file(str(path)) == {"llm": {"provider": "openai"}}
+
+
+def test_deep_merge_nested():
+    """Test that nested dicts are merged and base is left untouched."""
+    base = {"llm": {"provider": "openai", "model": "gpt-4"}, "logging": {"level": "INFO"}}
+    override = {"llm": {"model": "gpt-4o"}, "processing": {"max_events": 10}}
+
+    merged = deep_merge(base, override)
+
+    assert merged == {
+        "llm": {"provider": "openai", "model": "gpt-4o"},
+        "logging": {"level": "INFO"},
+        "processing": {"max_events": 10},
+    }
+    assert base["llm"]["model"] == "gpt-4"
+
+
+def test_deep_merge_non_dict_replaces():
+    """Test that a non-dict override replaces a dict value."""
+    assert deep_merge({"llm": {"provider": "openai"}}, {"llm": None}) == {"llm": None}
+
+
+def test_deep_merge_empty_side_short_circuits():
+    """Test that merging with an empty dict returns the other side unchanged."""
+    config = {"llm": {"provider": "openai"}}
+
+    assert deep_merge(config, {}) is config
+    assert deep_merge({}, config) is config
+
+
+def test_get_env_config(monkeypatch):
+    """Test that environment variables are cast into nested sections."""
+    monkeypatch.setenv("ADAPT_RCA_LLM_PROVIDER", "anthropic")
+    monkeypatch.setenv("ADAPT_RCA_LLM_TIMEOUT", "45")
+    monkeypatch.setenv("ADAPT_RCA_USE_CAUSAL_GRAPH", "No")
+    monkeypatch.setenv("ADAPT_RCA_CONFIDENCE_THRESHOLD", "0.8")
+    monkeypatch.setenv("ADAPT_RCA_LOG_FILE", "")
+
+    config = get_env_config()
+
+    assert config["llm"] == {"provider": "anthropic", "timeout": 45}
+    assert config["analysis"] == {"use_causal_graph": False, "confidence_threshold": 0.8}
+    assert "logging" not in config
+
+
+def test_get_env_config_invalid_value_ignored(monkeypatch, caplog):
+    """Test that values that fail to cast are skipped with a warning."""
+    monkeypatch.setenv("ADAPT_RCA_MAX_EVENTS", "lots")
+
+    config = get_env_config()
+
+    assert "processing" not in config
+    assert "Invalid ADAPT_RCA_MAX_EVENTS" in caplog.text
+
+
+def test_find_config_file_prefers_cwd_yaml(tmp_path, monkeypatch):
+    """Test search order within the current directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    (tmp_path / "adapt-rca.toml").write_text("")
+    (tmp_path / "adapt-rca.yaml").write_text("")
+
+    assert find_config_file() == tmp_path / "adapt-rca.yaml"
+
+
+def test_find_config_file_skips_directories(tmp_path, monkeypatch):
+    """Test that a directory named like a config file is not returned."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    (tmp_path / "adapt-rca.yaml").mkdir()
+    (tmp_path / "adapt-rca.toml").write_text("")
+
+    assert find_config_file() == tmp_path / "adapt-rca.toml"
+
+
+def test_find_config_file_follows_cwd_changes(tmp_path, monkeypatch):
+    """Test that the search uses the current directory at call time."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    first, second = tmp_path / "a", tmp_path / "b"
+    for d in (first, second):
+        d.mkdir()
+        (d / "adapt-rca.yaml").write_text("")
+
+    monkeypatch.chdir(first)
+    assert find_config_file() == first / "adapt-rca.yaml"
+    monkeypatch.chdir(second)
+    assert find_config_file() == second / "adapt-rca.yaml"
+
+
+def test_merge_config_env_takes_precedence():
+    """Test that env values override file values field by field."""
+    file_config = {
+        "llm": {"provider": "openai", "model": "gpt-4"},
+        "logging": {"level": "DEBUG", "file": "/tmp/rca.log"},
+    }
+    env_config = {"llm": {"model": "gpt-4o"}, "processing": {"max_events": 10}}
+
+    assert merge_config(file_config, env_config) == {
+        "llm_provider": "openai",
+        "llm_model": "gpt-4o",
+        "max_events": 10,
+        "log_level": "DEBUG",
+        "log_file": "/tmp/rca.log",
+    }
+
+
+def test_merge_config_empty_section():
+    """Test that an empty YAML section (parsed as None) is tolerated."""
+    assert merge_config({"llm": None}, {"llm": {"provider": "none"}}) == {"llm_provider": "none"}
+
+
+def test_flatten_config():
+    """Test that nested sections map onto RCAConfig field names."""
+    config = {
+        "llm": {"provider": "openai", "timeout": 20},
+        "analysis": {"use_causal_graph": False},
+        "logging": {"level": "WARNING"},
+        "unknown": {"ignored": True},
+    }
+
+    assert flatten_config(config) == {
+        "llm_provider": "openai",
+        "llm_timeout": 20,
+        "use_causal_graph": False,
+        "log_level": "WARNING",
+    }
+
+
+def test_load_config_with_overrides_tracks_env(tmp_path, monkeypatch):
+    """Test that memoized results are invalidated by env changes."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_text("llm:\n  provider: openai\n  model: gpt-4\n")
+
+    assert load_config_with_overrides(str(path))["llm_model"] == "gpt-4"
+
+    monkeypatch.setenv("ADAPT_RCA_LLM_MODEL", "gpt-4o")
+    assert load_config_with_overrides(str(path))["llm_model"] == "gpt-4o"
+
+
+def test_load_config_with_overrides_returns_copy(tmp_path):
+    """Test that mutating a returned config does not affect later calls."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_text("llm:\n  provider: openai\n")
+
+    load_config_with_overrides(str(path))["llm_provider"] = "mutated"
+
+    assert load_config_with_overrides(str(path))["llm_provider"] == "openai"
+
+
+def test_load_config_with_overrides_missing_file():
+    """Test that a missing explicit path still raises."""
+    with pytest.raises(FileNotFoundError):
+        load_config_with_overrides("/nonexistent/adapt-rca.yaml")
+
+
+def test_load_yaml_config_utf8(tmp_path):
+    """Test that non-ASCII YAML content is decoded correctly."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_bytes("logging:\n  file: /var/log/rca-é.log\n".encode("utf-8"))
+
+    assert load_config_file(str(path)) == {"logging": {"file": "/var/log/rca-é.log"}}
+
+
+def test_load_config_with_overrides_leaves_file_cache_intact(tmp_path, monkeypatch):
+    """Test that merging env overrides never mutates the cached file parse."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_text("llm:\n  provider: openai\n  model: gpt-4\n")
+    monkeypatch.setenv("ADAPT_RCA_LLM_MODEL", "gpt-4o")
+
+    load_config_with_overrides(str(path))
+
+    assert load_config_file(str(path)) == {"llm": {"provider": "openai", "model": "gpt-4"}}
+
+
+def test_load_yaml_config_invalid(tmp_path):
+    """Test that malformed YAML raises InvalidConfigError."""
+    path = tmp_path / "adapt-rca.yaml"
+    path.write_text("llm: [unclosed\n")
+
+    with pytest.raises(InvalidConfigError, match="Failed to parse YAML"):
+        load_config_file(str(path))
+
+
+def test_load_toml_config_invalid(tmp_path):
+    """Test that malformed TOML raises InvalidConfigError."""
+    path = tmp_path / "adapt-rca.toml"
+    path.write_text("[llm\n")
+
+    with pytest.raises(InvalidConfigError, match="Failed to parse TOML"):
+        load_config_file(str(path))
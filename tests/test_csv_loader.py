@@ -0,0 +1,43 @@
+"""
+Tests for the CSV loader.
+"""
+from src.adapt_rca.ingestion.csv_loader import load_csv
+from src.adapt_rca.ingestion.loader_factory import FileLoaderFactory
+
+
+def test_load_csv_maps_header_columns(tmp_path):
+    """Test mapped columns are extracted and empty or missing cells skipped."""
+    path = tmp_path / "events.csv"
+    path.write_text(
+        "timestamp,extra,component,severity,message\n"
+        "2024-01-01T00:00:00Z,x,api,error,boom\n"
+        "\n"
+        "2024-01-01T00:01:00Z,x,,warn\n"
+        ",,,,\n",
+        encoding="utf-8",
+    )
+
+    assert list(load_csv(path)) == [
+        {"timestamp": "2024-01-01T00:00:00Z", "service": "api", "level": "error", "message": "boom"},
+        {"timestamp": "2024-01-01T00:01:00Z", "level": "warn"},
+    ]
+
+
+def test_load_csv_without_header(tmp_path):
+    """Test headerless rows use the positional column order."""
+    path = tmp_path / "events.csv"
+    path.write_text("t1,api,ERROR,boom\nshort,row\n", encoding="utf-8")
+
+    assert list(load_csv(path, has_header=False)) == [
+        {"timestamp": "t1", "service": "api", "level": "ERROR", "message": "boom"},
+    ]
+
+
+def test_load_batches_via_factory(tmp_path):
+    """Test the factory loaders can yield events in batches."""
+    path = tmp_path / "events.csv"
+    path.write_text("service,message\n" + "api,boom\n" * 3, encoding="utf-8")
+
+    loader = FileLoaderFactory.get_loader("csv")
+
+    assert [len(b) for b in loader.load_batches(path, batch_size=2)] == [2, 1]
@@ -0,0 +1,67 @@
+"""
+Tests for graph exporters.
+"""
+from src.adapt_rca.reporting.exporters import (
+    export_graph_dot,
+    export_graph_mermaid,
+    iter_graph_dot,
+    iter_graph_mermaid,
+)
+
+
+GRAPH = {
+    "nodes": [
+        {"id": "api-gateway", "error_count": 3},
+        {"id": "db.primary", "error_count": 5},
+    ],
+    "edges": [
+        {"from": "db.primary", "to": "api-gateway", "confidence": 0.854, "time_delta_seconds": 42.4},
+        {"from": "api-gateway", "to": "db.primary", "confidence": 0.5},
+    ],
+    "root_causes": ["db.primary"],
+}
+
+
+def test_export_graph_mermaid(tmp_path):
+    """Test Mermaid output for nodes, edges and ID sanitisation."""
+    path = tmp_path / "graph.mmd"
+
+    export_graph_mermaid(GRAPH, path)
+
+    assert path.read_text(encoding="utf-8") == (
+        'graph TD\n'
+        '    api_gateway["api-gateway<br/>Errors: 3"]\n'
+        '    db_primary["db.primary<br/>Errors: 5"]\n'
+        '    db_primary -->|"0.85<br/>42s"| api_gateway\n'
+        '    api_gateway -->|"0.50"| db_primary'
+    )
+
+
+def test_export_graph_dot(tmp_path):
+    """Test DOT output including root cause highlighting."""
+    path = tmp_path / "graph.dot"
+
+    export_graph_dot(GRAPH, path)
+
+    assert path.read_text(encoding="utf-8") == (
+        'digraph CausalGraph {\n'
+        '    rankdir=LR;\n'
+        '    node [shape=box];\n'
+        '    "api-gateway" [label="api-gateway\\nErrors: 3"];\n'
+        '    "db.primary" [label="db.primary\\nErrors: 5", style=filled, fillcolor=lightcoral];\n'
+        '    "db.primary" -> "api-gateway" [label="conf: 0.85\\n42s"];\n'
+        '    "api-gateway" -> "db.primary" [label="conf: 0.50"];\n'
+        '}'
+    )
+
+
+def test_iter_graph_lines_match_export(tmp_path):
+    """Test the line generators produce the same text as the exporters."""
+    mmd = tmp_path / "graph.mmd"
+    dot = tmp_path / "graph.dot"
+    export_graph_mermaid(GRAPH, mmd)
+    export_graph_dot(GRAPH, dot)
+
+    assert "\n".join(iter_graph_mermaid(GRAPH)) == mmd.read_text(encoding="utf-8")
+    assert "\n".join(iter_graph_dot(GRAPH)) == dot.read_text(encoding="utf-8")
+    assert next(iter_graph_dot(GRAPH)) == "digraph CausalGraph {"
@@ -0,0 +1,79 @@
+"""
+Tests for the JSONL file loader.
+"""
+import io
+
+from src.adapt_rca.ingestion import file_loader
+from src.adapt_rca.ingestion.file_loader import (
+    _iter_lines,
+    load_jsonl,
+    load_jsonl_batches,
+    load_jsonl_columns,
+)
+
+
+def test_iter_lines_across_chunk_boundaries():
+    """Test lines are reassembled when they span several chunks."""
+    data = b'{"a": 1}\n\n{"b": "' + b"x" * 20 + b'"}\r\n{"c": 3}'
+
+    lines = list(_iter_lines(io.BytesIO(data), chunk_size=4))
+
+    assert lines == data.split(b"\n")
+
+
+def test_load_jsonl_skips_blank_and_invalid_lines(tmp_path, caplog):
+    """Test blank lines are ignored and invalid lines are reported by number."""
+    path = tmp_path / "events.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n   \nnot json\n{"b": 2}')
+
+    assert list(load_jsonl(path)) == [{"a": 1}, {"b": 2}]
+    assert "Skipped 1 invalid JSON lines" in caplog.text
+    assert "line 4" in caplog.text
+
+
+def test_iter_lines_long_line_without_newline():
+    """Test a line longer than many chunks is yielded once, intact."""
+    data = b"y" * 1000 + b"\nz"
+
+    assert list(_iter_lines(io.BytesIO(data), chunk_size=16)) == [b"y" * 1000, b"z"]
+
+
+def test_load_jsonl_memory_mapped(tmp_path, monkeypatch):
+    """Test large files are read through mmap with the same results."""
+    monkeypatch.setattr(file_loader, "_MMAP_THRESHOLD", 1)
+    path = tmp_path / "events.jsonl"
+    path.write_bytes(b'{"a": 1}\n\nbad\n{"b": 2}')
+
+    assert list(load_jsonl(path)) == [{"a": 1}, {"b": 2}]
+
+
+def test_load_jsonl_batches(tmp_path):
+    """Test objects are grouped into batches with a short final batch."""
+    path = tmp_path / "events.jsonl"
+    path.write_bytes(b"".join(b'{"n": %d}\n' % i for i in range(5)))
+
+    batches = list(load_jsonl_batches(path, batch_size=2))
+
+    assert [[e["n"] for e in b] for b in batches] == [[0, 1], [2, 3], [4]]
+
+
+def test_load_jsonl_columns(tmp_path):
+    """Test fields are gathered into aligned columns with None for gaps."""
+    path = tmp_path / "events.jsonl"
+    path.write_bytes(b'{"service": "api", "level": "ERROR"}\n[1, 2]\n{"level": "INFO", "extra": 1}\n')
+
+    assert load_jsonl_columns(path, fields=("service", "level")) == {
+        "service": ["api", None],
+        "level": ["ERROR", "INFO"],
+    }
+
+
+def test_load_jsonl_shares_level_strings(tmp_path):
+    """Test repeated level/service values are the same string object."""
+    path = tmp_path / "events.jsonl"
+    path.write_bytes(b'{"level": "ERROR", "service": "api"}\n' * 2)
+
+    first, second = load_jsonl(path)
+
+    assert first["level"] is second["level"]
+    assert first["service"] is second["service"]
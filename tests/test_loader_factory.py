@@ -0,0 +1,61 @@
+"""
+Tests for the file loader factory.
+"""
+from src.adapt_rca.ingestion.loader_factory import (
+    CSVLoader,
+    FileLoader,
+    FileLoaderFactory,
+    TextLoader,
+)
+
+
+def test_load_many_mixed_formats(tmp_path):
+    """Test events from several files are tagged with their source path."""
+    jsonl = tmp_path / "a.jsonl"
+    jsonl.write_text('{"message": "one"}\n', encoding="utf-8")
+    csv_file = tmp_path / "b.csv"
+    csv_file.write_text("service,message\napi,two\n", encoding="utf-8")
+    log = tmp_path / "c.log"
+    log.write_text("2024-01-01 10:00:00 ERROR three\n", encoding="utf-8")
+
+    results = list(FileLoaderFactory.load_many([jsonl, str(csv_file), log]))
+
+    assert [(p.name, e["message"]) for p, e in results] == [
+        ("a.jsonl", "one"),
+        ("b.csv", "two"),
+        ("c.log", "three"),
+    ]
+
+
+def test_load_many_parallel_matches_sequential(tmp_path):
+    """Test parallel loading yields the same events in the same order."""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.jsonl"
+        path.write_text("".join(f'{{"n": {i * 10 + j}}}\n' for j in range(4)), encoding="utf-8")
+        paths.append(path)
+
+    parallel = list(FileLoaderFactory.load_many_parallel(paths, workers=2))
+
+    assert parallel == list(FileLoaderFactory.load_many(paths))
+    assert [e["n"] for _, e in parallel] == [0, 1, 2, 3, 10, 11, 12, 13, 20, 21, 22, 23]
+
+
+def test_get_loader_for_file_uses_registered_extensions(monkeypatch):
+    """Test extension lookup, the text fallback and newly registered loaders."""
+    monkeypatch.setattr(FileLoaderFactory, "_loaders", dict(FileLoaderFactory._loaders))
+    monkeypatch.setattr(FileLoaderFactory, "_ext_map", dict(FileLoaderFactory._ext_map))
+
+    assert isinstance(FileLoaderFactory.get_loader_for_file("a.CSV"), CSVLoader)
+    assert isinstance(FileLoaderFactory.get_loader_for_file("a.unknown"), TextLoader)
+
+    class XMLLoader(FileLoader):
+        supported_extensions = [".xml"]
+
+        def load(self, path, **kwargs):
+            return iter(())
+
+    xml_loader = XMLLoader()
+    FileLoaderFactory.register_loader("xml", xml_loader)
+
+    assert FileLoaderFactory.get_loader_for_file("data.xml") is xml_loader
@@ -0,0 +1,175 @@
+"""
+Tests for OpenTelemetry trace analysis.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.adapt_rca.integrations import opentelemetry_support as otel
+from src.adapt_rca.integrations.opentelemetry_support import OpenTelemetryAnalyzer, Span, Trace
+
+T0 = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_span(span_id, parent, service, start_ms, end_ms, status="OK"):
+    return Span(
+        trace_id="t1",
+        span_id=span_id,
+        parent_span_id=parent,
+        name=f"op-{span_id}",
+        kind="SERVER",
+        start_time=T0 + timedelta(milliseconds=start_ms),
+        end_time=T0 + timedelta(milliseconds=end_ms),
+        service_name=service,
+        status_code=status,
+    )
+
+
+def test_analyze_dependencies():
+    """Test cross-service parent/child pairs are reported once each."""
+    trace = Trace(trace_id="t1", spans=[
+        make_span("a", None, "gateway", 0, 100),
+        make_span("b", "a", "orders", 10, 90),
+        make_span("c", "b", "orders", 20, 30),
+        make_span("d", "b", "db", 30, 80),
+        make_span("e", "b", "db", 80, 85),
+        make_span("f", "missing", "cache", 0, 1),
+    ])
+
+    deps = OpenTelemetryAnalyzer()._analyze_dependencies(trace)
+
+    assert [(d["caller"], d["callee"]) for d in deps] == [("gateway", "orders"), ("orders", "db")]
+    assert trace.span_index["d"].service_name == "db"
+
+
+def test_get_critical_path_picks_longest_chain():
+    """Test the path follows the child chain with the largest total duration."""
+    trace = Trace(trace_id="t1", spans=[
+        make_span("root", None, "gateway", 0, 100),
+        make_span("fast", "root", "cache", 0, 50),
+        make_span("slow", "root", "orders", 0, 40),
+        make_span("slow-db", "slow", "db", 0, 30),
+        make_span("fast-leaf", "fast", "cache", 0, 5),
+    ])
+
+    assert [s.span_id for s in trace.get_critical_path()] == ["root", "slow", "slow-db"]
+
+
+def test_get_critical_path_deep_trace():
+    """Test a chain deeper than the recursion limit is handled."""
+    spans = [make_span("0", None, "svc", 0, 1)]
+    spans += [make_span(str(i), str(i - 1), "svc", 0, 1) for i in range(1, 5000)]
+
+    path = Trace(trace_id="t1", spans=spans).get_critical_path()
+
+    assert len(path) == 5000
+    assert path[-1].span_id == "4999"
+
+
+def test_span_and_trace_use_slots():
+    """Test per-span and per-trace objects carry no instance __dict__."""
+    span = make_span("a", None, "svc", 0, 10)
+    trace = Trace(trace_id="t1", spans=[span])
+
+    assert not hasattr(span, "__dict__")
+    assert not hasattr(trace, "__dict__")
+    assert span.duration_ms == 10
+    assert trace.root_span is span
+
+
+def test_parse_trace_bytes():
+    """Test OTLP JSON is decoded and parsed, with missing nested objects tolerated."""
+    raw = (
+        b'{"traceId": "t9", "spans": ['
+        b'{"spanId": "a", "name": "GET /", "startTimeUnixNano": 1000000000,'
+        b' "endTimeUnixNano": 1500000000,'
+        b' "resource": {"attributes": {"service.name": "gateway"}},'
+        b' "status": {"code": "ERROR", "message": "boom"}},'
+        b'{"spanId": "b", "parentSpanId": "a", "startTimeUnixNano": 1000000000,'
+        b' "endTimeUnixNano": 1100000000}'
+        b']}'
+    )
+
+    trace = OpenTelemetryAnalyzer().parse_trace_bytes(raw)
+
+    assert trace.trace_id == "t9"
+    assert [s.service_name for s in trace.spans] == ["gateway", "unknown"]
+    assert trace.spans[0].status_message == "boom"
+    assert trace.spans[1].status_code == "UNSET"
+    assert trace.root_span.span_id == "a"
+    assert trace.spans[0].duration_ms == 500
+
+
+@pytest.mark.parametrize("group_by", ["service", "operation"])
+def test_aggregate_traces_matches_python(monkeypatch, group_by):
+    """Test the NumPy and pure-Python aggregations agree exactly."""
+    traces = [
+        Trace(trace_id="t1", spans=[
+            make_span("a", None, "gateway", 0, 100),
+            make_span("b", "a", "orders", 10, 40, status="ERROR"),
+            make_span("c", "a", "orders", 0, 7),
+        ]),
+        Trace(trace_id="t2", spans=[make_span("d", None, "orders", 0, 3)]),
+        Trace(trace_id="t3", spans=[]),
+    ]
+    analyzer = OpenTelemetryAnalyzer()
+
+    result = analyzer.aggregate_traces(traces, group_by=group_by)
+    monkeypatch.setattr(otel, "np", None)
+    expected = analyzer.aggregate_traces(traces, group_by=group_by)
+
+    assert result == expected
+    assert list(result) == list(expected)
+    assert analyzer.aggregate_traces([], group_by=group_by) == {}
+
+
+def test_parse_timestamp_keeps_microseconds():
+    """Test large nanosecond timestamps convert without float rounding."""
+    analyzer = OpenTelemetryAnalyzer()
+    nanos = 1_700_000_000_123_456_789
+
+    parsed = analyzer._parse_timestamp(nanos)
+
+    assert parsed == datetime.fromtimestamp(1_700_000_000).replace(microsecond=123456)
+    assert analyzer._parse_timestamp(str(nanos)) == parsed
+
+
+def test_span_duration_precomputed():
+    """Test the duration is fixed at construction and excluded from repr and equality."""
+    span = make_span("a", None, "svc", 0, 12.5)
+
+    assert span.duration_ms == 12.5
+    assert "_duration_ms" not in repr(span)
+    assert span == make_span("a", None, "svc", 0, 12.5)
+
+
+def test_trace_computed_fields():
+    """Test the single-pass initialization of derived trace fields."""
+    trace = Trace(trace_id="t1", spans=[
+        make_span("b", "a", "db", 5, 120, "ERROR"),
+        make_span("a", None, "gateway", 0, 100),
+        make_span("c", "a", "cache", 10, 20),
+    ])
+
+    assert trace.root_span.span_id == "a"
+    assert trace.services == {"gateway", "db", "cache"}
+    assert trace.has_errors
+    assert trace.total_duration_ms == 120
+    assert [s.span_id for s in trace.children_index["a"]] == ["b", "c"]
+
+
+def test_detect_error_propagation():
+    """Test consecutive error spans within the window are chained, in start order."""
+    trace = Trace(trace_id="t1", spans=[
+        make_span("c", "b", "db", 150, 160, "ERROR"),
+        make_span("a", None, "gateway", 0, 10, "ERROR"),
+        make_span("b", "a", "orders", 40, 100, "ERROR"),
+        make_span("d", "a", "cache", 120, 170, "ERROR"),
+    ])
+
+    chain = OpenTelemetryAnalyzer(error_propagation_window_ms=30)._detect_error_propagation(trace)
+
+    assert chain == [
+        {'from_service': 'gateway', 'to_service': 'orders', 'time_diff_ms': 30.0},
+        {'from_service': 'orders', 'to_service': 'cache', 'time_diff_ms': 20.0},
+    ]
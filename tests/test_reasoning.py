@@ -2,7 +2,10 @@
 Tests for reasoning module.
 """
 import pytest
-from src.adapt_rca.reasoning.heuristics import simple_grouping
+from datetime import datetime, timedelta, timezone
+
+from src.adapt_rca.models import Event
+from src.adapt_rca.reasoning.heuristics import simple_grouping, time_window_grouping
 from src.adapt_rca.reasoning.agent import analyze_incident
 
 
@@ -62,3 +65,46 @@ def test_analyze_incident_single_service():
     result = analyze_incident(events)
 
     assert "database" in result["incident_summary"]
+
+
+def test_time_window_grouping_splits_on_gap():
+    """Test that a gap larger than the window starts a new incident."""
+    start = datetime(2024, 1, 1, 10, 0)
+    events = [
+        Event(service="api", timestamp=start),
+        Event(service="db", timestamp=start + timedelta(minutes=15)),
+        Event(service="cache", timestamp=start + timedelta(minutes=30, seconds=1)),
+    ]
+
+    groups = time_window_grouping(events, window_minutes=15)
+
+    assert [len(g.events) for g in groups] == [2, 1]
+    assert groups[0].start_time == start
+    assert groups[0].end_time == start + timedelta(minutes=15)
+
+
+def test_time_window_grouping_aware_timestamps():
+    """Test grouping with timezone-aware timestamps in different zones."""
+    utc = datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+    plus_two = timezone(timedelta(hours=2))
+    events = [
+        Event(service="api", timestamp=utc),
+        Event(service="db", timestamp=datetime(2024, 1, 1, 12, 5, tzinfo=plus_two)),
+    ]
+
+    groups = time_window_grouping(events, window_minutes=15)
+
+    assert len(groups) == 1
+    assert [e.service for e in groups[0].events] == ["api", "db"]
+
+
+def test_time_window_grouping_untimed_events_separate():
+    """Test that events without timestamps form their own group."""
+    events = [
+        Event(service="api", timestamp=datetime(2024, 1, 1, 10, 0)),
+        Event(service="db"),
+    ]
+
+    groups = time_window_grouping(events, window_minutes=15)
+
+    assert [[e.service for e in g.events] for g in groups] == [["api"], ["db"]]
@@ -0,0 +1,88 @@
+"""
+Tests for the text log loader.
+"""
+from src.adapt_rca.ingestion.text_loader import load_text_log
+
+
+def test_auto_detect_mixed_formats(tmp_path):
+    """Test auto-detection handles a change of format within a file."""
+    path = tmp_path / "app.log"
+    path.write_text(
+        "2024-01-01 10:00:00 ERROR [db] connection refused\n"
+        "2024-01-01 10:00:01 INFO [api] retrying\n"
+        "# comment\n"
+        "Jan  1 10:00:02 host1 sshd[42]: session opened\n"
+        "this line matches nothing\n"
+        "2024-01-01 10:00:03 WARN slow query\n",
+        encoding="utf-8",
+    )
+
+    events = list(load_text_log(path))
+
+    assert [e["message"] for e in events] == [
+        "connection refused",
+        "retrying",
+        "session opened",
+        "slow query",
+    ]
+    assert events[2]["service"] == "sshd"
+    assert events[2]["pid"] == "42"
+
+
+def test_access_log_level_and_message(tmp_path):
+    """Test access logs get a level from the status code and a built message."""
+    path = tmp_path / "access.log"
+    path.write_text(
+        '10.0.0.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api HTTP/1.1" 503 12\n'
+        '10.0.0.2 - - [01/Jan/2024:10:00:01 +0000] "POST /login HTTP/1.1" 404 -\n',
+        encoding="utf-8",
+    )
+
+    events = list(load_text_log(path))
+
+    assert [(e["level"], e["service"], e["message"]) for e in events] == [
+        ("ERROR", "web", "GET /api - 503"),
+        ("WARN", "web", "POST /login - 404"),
+    ]
+
+
+def test_custom_pattern_without_service(tmp_path):
+    """Test custom patterns get the same post-processing and drop None groups."""
+    path = tmp_path / "custom.log"
+    path.write_text("E|oops\nI|\n", encoding="utf-8")
+
+    events = list(load_text_log(path, custom_pattern=r"^(?P<level>\w)\|(?P<message>.+)?$"))
+
+    assert events == [{"level": "E", "message": "oops"}, {"level": "I"}]
+
+
+def test_custom_pattern_with_backreference(tmp_path):
+    """Test patterns that need the backtracking engine still work."""
+    path = tmp_path / "custom.log"
+    path.write_text("ab ab repeated\nab cd not\n", encoding="utf-8")
+
+    events = list(load_text_log(path, custom_pattern=r"^(?P<service>\w+) (?P=service) (?P<message>.+)$"))
+
+    assert events == [{"service": "ab", "message": "repeated"}]
+
+
+def test_generic_pattern_is_case_insensitive(tmp_path):
+    """Test lower-case levels are recognised."""
+    path = tmp_path / "app.log"
+    path.write_text("2024-01-01T10:00:00Z error [db] down\n", encoding="utf-8")
+
+    assert list(load_text_log(path, log_format="generic")) == [
+        {"timestamp": "2024-01-01T10:00:00Z", "level": "error", "service": "db", "message": "down"}
+    ]
+
+
+def test_custom_pattern_matches_unicode_word_characters(tmp_path):
+    """Test \\w in a custom pattern matches non-ASCII letters, whatever engine is installed."""
+    log_file = tmp_path / "app.log"
+    log_file.write_text("сервис: boom\n", encoding="utf-8")
+
+    events = list(load_text_log(
+        log_file, log_format="custom", custom_pattern=r"(?P<service>\w+): (?P<message>.*)"
+    ))
+
+    assert events == [{"service": "сервис", "message": "boom"}]
@@ -0,0 +1,184 @@
+"""
+Tests for the webhook receiver.
+"""
+import hashlib
+import hmac
+import json
+
+import pytest
+
+from src.adapt_rca.integrations.webhook_receiver import WebhookReceiver
+
+
+def sign(secret, payload):
+    body = payload if isinstance(payload, bytes) else json.dumps(
+        payload, sort_keys=True, separators=(",", ":")
+    ).encode()
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def test_receive_verifies_signature():
+    """Test a correctly signed payload is verified and a bad signature rejected."""
+    receiver = WebhookReceiver()
+    receiver.register_secret("github", "s3cret")
+    payload = {"b": 1, "a": [1, 2]}
+
+    event = receiver.receive("github", payload, {}, signature=sign("s3cret", payload))
+
+    assert event.verified
+    assert len(event.event_id) == 16
+    with pytest.raises(ValueError, match="Invalid signature"):
+        receiver.receive("github", payload, {}, signature=sign("other", payload))
+    with pytest.raises(ValueError, match="Signature required"):
+        receiver.receive("github", payload, {})
+
+
+def test_receive_unsigned_source_calls_handlers():
+    """Test sources without a secret are accepted unverified and dispatched."""
+    receiver = WebhookReceiver()
+    seen = []
+    receiver.on_event("slack")(seen.append)
+
+    event = receiver.receive("slack", {"text": "hi"}, {})
+
+    assert not event.verified
+    assert seen == [event]
+
+
+def test_verify_cache_reuses_results_until_secret_changes(monkeypatch):
+    """Test a redelivered webhook skips the HMAC, and re-registering the secret invalidates it."""
+    receiver = WebhookReceiver(verify_cache_size=2)
+    receiver.register_secret("github", "s3cret")
+    payload = {"action": "opened"}
+    signature = sign("s3cret", payload)
+    receiver.receive("github", payload, {}, signature=signature)
+
+    calls = []
+    original = receiver._verify_signature
+    monkeypatch.setattr(
+        receiver, "_verify_signature", lambda *args: calls.append(args) or original(*args)
+    )
+
+    assert receiver.receive("github", payload, {}, signature=signature).verified
+    assert calls == []
+
+    receiver.register_secret("github", "rotated")
+    with pytest.raises(ValueError, match="Invalid signature"):
+        receiver.receive("github", payload, {}, signature=signature)
+    assert len(calls) == 1
+
+
+def test_history_is_bounded_and_newest_first():
+    """Test history keeps the most recent events and filters by source."""
+    receiver = WebhookReceiver(max_history=5)
+    for i in range(8):
+        receiver.receive("a" if i % 2 else "b", {"i": i}, {})
+
+    assert [e.payload["i"] for e in receiver.get_history()] == [7, 6, 5, 4, 3]
+    assert [e.payload["i"] for e in receiver.get_history(source="a", limit=2)] == [7, 5]
+    assert receiver.get_stats()["total_events"] == 5
+
+
+def test_stats_track_evictions():
+    """Test per-source counts and the verified count follow history eviction."""
+    receiver = WebhookReceiver(max_history=3)
+    receiver.register_secret("github", "s3cret")
+    for payload in ({"n": 1}, {"n": 2}):
+        receiver.receive("github", payload, {}, signature=sign("s3cret", payload))
+    for i in range(2):
+        receiver.receive("slack", {"i": i}, {})
+
+    stats = receiver.get_stats()
+
+    assert stats["total_events"] == 3
+    assert stats["verified_events"] == 1
+    assert stats["by_source"] == {"github": 1, "slack": 2}
+
+    for i in range(3):
+        receiver.receive("slack", {"i": i}, {})
+    assert receiver.get_stats()["by_source"] == {"slack": 3}
+    assert receiver.get_stats()["verified_events"] == 0
+    assert receiver.get_history(source="github") == []
+
+
+def test_receive_verifies_raw_body():
+    """Test the raw request body is what gets verified when it is provided."""
+    receiver = WebhookReceiver()
+    receiver.register_secret("github", "s3cret")
+    raw = b'{ "zeta": 1,  "alpha": "\\u00e9" }'
+    payload = json.loads(raw)
+
+    assert receiver.receive("github", payload, {}, sign("s3cret", raw), raw_body=raw).verified
+    with pytest.raises(ValueError, match="Invalid signature"):
+        receiver.receive("github", payload, {}, sign("s3cret", raw))
+    assert receiver.receive("github", payload, {}, sign("s3cret", payload)).verified
+
+
+def test_receive_parses_raw_body_after_verification():
+    """Test payload=None parses the verified raw body, and rejects bad bodies."""
+    receiver = WebhookReceiver()
+    receiver.register_secret("github", "s3cret")
+    raw = b'{"action": "opened"}'
+
+    event = receiver.receive("github", None, {}, sign("s3cret", raw), raw_body=raw)
+
+    assert event.payload == {"action": "opened"}
+    with pytest.raises(ValueError, match="Invalid signature"):
+        receiver.receive("github", None, {}, sign("s3cret", b"{}"), raw_body=b"not json")
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        receiver.receive("github", None, {}, sign("s3cret", b"not json"), raw_body=b"not json")
+
+
+def test_webhook_app_verifies_raw_request_body():
+    """Test the Flask endpoint checks the signature against the body as sent."""
+    pytest.importorskip("flask")
+    from src.adapt_rca.integrations.webhook_receiver import create_webhook_app
+
+    receiver = WebhookReceiver()
+    receiver.register_secret("github", "s3cret")
+    client = create_webhook_app(receiver).test_client()
+    raw = b'{"zeta": 1, "alpha": 2}'
+
+    ok = client.post("/webhook/github", data=raw, content_type="application/json",
+                     headers={"X-Hub-Signature-256": sign("s3cret", raw)})
+    bad = client.post("/webhook/github", data=raw, content_type="application/json",
+                      headers={"X-Hub-Signature-256": sign("s3cret", {"zeta": 1, "alpha": 2})})
+
+    assert ok.status_code == 200 and ok.get_json()["verified"]
+    assert bad.status_code == 401
+    assert receiver.get_history()[0].payload == {"zeta": 1, "alpha": 2}
+
+
+@pytest.mark.parametrize("signature,valid", [
+    (lambda good: good, True),
+    (lambda good: good.upper().replace("SHA256=", "sha256="), True),
+    (lambda good: good[:-2], False),
+    (lambda good: good[:-1] + "z", False),
+    (lambda good: "", False),
+])
+def test_verify_signature_formats(signature, valid):
+    """Test hex signatures are compared as digests; malformed ones are rejected."""
+    receiver = WebhookReceiver()
+    receiver.register_secret("github", "s3cret")
+    good = sign("s3cret", b"body")
+
+    assert receiver._verify_signature("github", b"body", signature(good)) is valid
+
+
+def test_empty_secret_never_verifies():
+    """Test a source registered with an empty secret rejects every signature."""
+    receiver = WebhookReceiver()
+    receiver.register_secret("github", "s3cret")
+    receiver.register_secret("github", "")
+
+    assert not receiver._verify_signature("github", b"body", sign("", b"body"))
+
+
+def test_receive_payload_with_lone_surrogate():
+    """Test payloads holding lone surrogates (valid JSON) can be hashed and signed."""
+    receiver = WebhookReceiver()
+    receiver.register_secret("github", "s3cret")
+    payload = json.loads('{"a": "\\ud800", "b": "\u00e9"}')
+
+    assert not receiver.receive("slack", payload, {}).verified
+    assert receiver.receive("github", payload, {}, sign("s3cret", payload)).verified